@@ -6,14 +6,17 @@ This script fetches:
 1. Census TIGER/Line county boundaries (2023)
 2. CDC PLACES county health data (2023)
 3. USDA Rural-Urban Continuum Codes (2023)
+4. Census county adjacency table
 """
 
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-import urllib.request
 import zipfile
 import shutil
 
+import requests
+
 # Add src to path
 sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
 
@@ -24,35 +27,130 @@ logger = get_logger(__name__)
 
 
 def download_file(url: str, dest: Path, desc: str) -> None:
-    """Download a file with progress indication."""
-    logger.info(f"Downloading {desc}...")
-    logger.info(f"  URL: {url}")
-    logger.info(f"  Destination: {dest}")
+    """
+    Stream a file to disk in 64 KB chunks with progress indication.
+
+    The response ETag is stored next to ``dest`` and sent back as
+    ``If-None-Match`` on the next run, so an unchanged file is skipped with
+    a 304 instead of being downloaded again. An interrupted download leaves
+    ``<dest>.part`` behind together with the server's validator; the next run
+    asks for the remaining bytes with ``Range``/``If-Range`` and appends them,
+    and starts over when the server answers with the full file instead.
+    Bodies are requested uncompressed so byte offsets match the file on disk.
+    """
+    logger.info("Downloading %s...", desc)
+    logger.info("  URL: %s", url)
+    logger.info("  Destination: %s", dest)
     
     dest.parent.mkdir(parents=True, exist_ok=True)
+    etag_path = dest.with_name(dest.name + ".etag")
+    partial_path = dest.with_name(dest.name + ".part")
+    validator_path = dest.with_name(dest.name + ".part.validator")
+
+    headers = {"Accept-Encoding": "identity"}
+    if dest.exists() and etag_path.exists():
+        headers["If-None-Match"] = etag_path.read_text().strip()
+
+    offset = 0
+    if partial_path.exists() and validator_path.exists():
+        offset = partial_path.stat().st_size
+        headers["Range"] = f"bytes={offset}-"
+        headers["If-Range"] = validator_path.read_text().strip()
     
     try:
-        urllib.request.urlretrieve(url, dest)
-        logger.info(f"✅ Downloaded {desc} ({dest.stat().st_size / 1024 / 1024:.1f} MB)")
+        with requests.get(url, headers=headers, stream=True, timeout=60) as response:
+            if response.status_code == 304:
+                logger.info("✅ %s unchanged since last download", desc)
+                return
+            if response.status_code == 416 and offset:
+                # The partial file no longer fits the remote one; start over
+                partial_path.unlink(missing_ok=True)
+                validator_path.unlink(missing_ok=True)
+                return download_file(url, dest, desc)
+            response.raise_for_status()
+
+            if response.status_code == 206:
+                logger.info("  Resuming at %.1f MB", offset / 1024 / 1024)
+                mode = "ab"
+            else:
+                mode = "wb"
+                # If-Range needs a strong validator: a non-weak ETag or Last-Modified
+                etag = response.headers.get("ETag", "")
+                validator = etag if etag and not etag.startswith("W/") else response.headers.get("Last-Modified")
+                if validator:
+                    validator_path.write_text(validator)
+                else:
+                    validator_path.unlink(missing_ok=True)
+
+            # Write to a sibling and rename so an interrupted download never
+            # leaves a truncated file at dest
+            with open(partial_path, mode) as f:
+                for chunk in response.iter_content(chunk_size=1 << 16):
+                    f.write(chunk)
+            partial_path.replace(dest)
+            validator_path.unlink(missing_ok=True)
+
+            etag = response.headers.get("ETag")
+            if etag:
+                etag_path.write_text(etag)
+            else:
+                etag_path.unlink(missing_ok=True)
+        logger.info("✅ Downloaded %s (%.1f MB)", desc, dest.stat().st_size / 1024 / 1024)
     except Exception as e:
-        logger.error(f"❌ Failed to download {desc}: {e}")
+        # Keep the partial file for the next run only when it can be resumed
+        if not validator_path.exists():
+            partial_path.unlink(missing_ok=True)
+        logger.error("❌ Failed to download %s: %s", desc, e)
         raise
 
 
+SHAPEFILE_SUFFIXES = {".shp", ".shx", ".dbf", ".prj", ".cpg"}
+
+
+def extract_shapefile_members(zip_ref: zipfile.ZipFile, extract_dir: Path) -> None:
+    """Extract only the shapefile components, skipping bundled metadata."""
+    members = [
+        name for name in zip_ref.namelist()
+        if Path(name).suffix.lower() in SHAPEFILE_SUFFIXES
+    ]
+    zip_ref.extractall(extract_dir, members=members)
+
+
 def download_tiger_counties() -> None:
     """Download Census TIGER/Line county boundaries."""
     url = "https://www2.census.gov/geo/tiger/TIGER2023/COUNTY/tl_2023_us_county.zip"
     zip_path = paths.data_raw / "shapefiles" / "tl_2023_us_county.zip"
     extract_dir = paths.data_raw / "shapefiles"
-    
+    extract_dir.mkdir(parents=True, exist_ok=True)
+
+    try:
+        import fsspec
+    except ImportError:
+        fsspec = None
+
+    if fsspec is not None:
+        # Range requests let zipfile read the central directory and only the
+        # members we keep, without staging the whole archive on disk.
+        logger.info("Streaming TIGER/Line Counties 2023...")
+        logger.info("  URL: %s", url)
+        try:
+            with fsspec.open(url, "rb") as remote:
+                with zipfile.ZipFile(remote) as zip_ref:
+                    extract_shapefile_members(zip_ref, extract_dir)
+            logger.info("✅ Extracted county boundaries")
+            return
+        except Exception as e:
+            logger.warning("Range-request extract failed (%s); downloading full archive", e)
+
     download_file(url, zip_path, "TIGER/Line Counties 2023")
-    
+
     logger.info("Extracting shapefile...")
     with zipfile.ZipFile(zip_path, 'r') as zip_ref:
-        zip_ref.extractall(extract_dir)
-    
-    # Clean up zip file
+        extract_shapefile_members(zip_ref, extract_dir)
+
+    # Clean up zip file (and its ETag, which no longer describes a local copy)
     zip_path.unlink()
+    zip_path.with_name(zip_path.name + ".etag").unlink(missing_ok=True)
     logger.info("✅ Extracted county boundaries")
 
 
@@ -74,6 +172,14 @@ def download_usda_rucc() -> None:
     download_file(url, dest, "USDA Rural-Urban Continuum Codes 2023")
 
 
+def download_county_adjacency() -> None:
+    """Download the Census county adjacency table."""
+    url = "https://www2.census.gov/geo/docs/reference/county_adjacency.txt"
+    dest = paths.data_raw / "census" / "county_adjacency.txt"
+
+    download_file(url, dest, "Census County Adjacency File")
+
+
 def create_acs_variables_manifest() -> None:
     """Create a basic ACS variables manifest for API queries."""
     import json
@@ -117,11 +223,19 @@ def main():
         (paths.data_raw / "usda").mkdir(parents=True, exist_ok=True)
         (paths.data_raw / "census").mkdir(parents=True, exist_ok=True)
         
-        # Download automated sources
-        download_tiger_counties()
-        download_cdc_places()
-        download_usda_rucc()
-        create_acs_variables_manifest()
+        # Download automated sources concurrently; the fetches are independent,
+        # so wall time is bounded by the slowest one rather than the sum.
+        downloads = (
+            download_tiger_counties,
+            download_cdc_places,
+            download_usda_rucc,
+            download_county_adjacency,
+        )
+        with ThreadPoolExecutor(max_workers=len(downloads)) as pool:
+            futures = [pool.submit(download) for download in downloads]
+            create_acs_variables_manifest()
+            for future in futures:
+                future.result()
         
         logger.info("")
         logger.info("=" * 70)
@@ -149,7 +263,7 @@ def main():
         logger.info("")
         
     except Exception as e:
-        logger.error(f"❌ Error downloading data: {e}")
+        logger.error("❌ Error downloading data: %s", e)
         return 1
     
     return 0
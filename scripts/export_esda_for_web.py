@@ -8,256 +8,670 @@ This script:
 3. Exports to web/assets/counties_esda.geojson with all required fields
 """
 
+import gzip
+import hashlib
+import inspect
+import os
+import pickle
+import shutil
+import subprocess
+import sys
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 import geopandas as gpd
 import pandas as pd
 import numpy as np
-from libpysal.weights import Queen
-from esda import Moran_Local, Moran_Local_BV
+import shapely
+from pyproj import Transformer
+from libpysal.weights import W, w_subset
+from esda import G_Local, Moran_Local, Moran_Local_BV
 import warnings
 warnings.filterwarnings('ignore')
 
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+from pain_politics.utils import get_logger
+
+logger = get_logger(__name__)
+
+
+def queen_weights(gdf: gpd.GeoDataFrame) -> W:
+    """
+    Build Queen contiguity weights by hashing shared polygon vertices.
+
+    Counties are neighbors when they share at least one vertex (the same rule
+    as ``Queen.from_dataframe``), but the vertices are bucketed with NumPy in a
+    single pass instead of libpysal's per-polygon Python loops. Ids are
+    positional, matching ``use_index=False``.
+    """
+    n = len(gdf)
+    geoms = gdf.geometry.values
+    coords = np.ascontiguousarray(shapely.get_coordinates(geoms))
+    owners = np.repeat(np.arange(n), shapely.get_num_coordinates(geoms))
+
+    # View each (x, y) pair as one complex number so identical vertices hash
+    # together with a 1-D unique, then keep one entry per (vertex, county).
+    _, vertex_ids = np.unique(coords.view(np.complex128).ravel(), return_inverse=True)
+    keys = np.unique(vertex_ids.reshape(-1).astype(np.int64) * n + owners)
+    vertex, county = np.divmod(keys, n)
+
+    # Counties sharing a vertex form contiguous runs in the sorted keys; pair
+    # every member of a run with the members that follow it.
+    left, right = [], []
+    offset = 1
+    while offset < len(vertex):
+        same = vertex[offset:] == vertex[:-offset]
+        if not same.any():
+            break
+        left.append(county[:-offset][same])
+        right.append(county[offset:][same])
+        offset += 1
+
+    neighbors = {i: [] for i in range(n)}
+    if left:
+        edges = np.unique(np.concatenate(left + right) * n + np.concatenate(right + left))
+        for i, j in zip(*(part.tolist() for part in np.divmod(edges, n))):
+            neighbors[i].append(j)
+    return W(neighbors)
+
+
+def adjacency_weights(gdf: gpd.GeoDataFrame, adjacency_path: Path):
+    """
+    Build contiguity weights from the Census county adjacency table.
+
+    The tab-delimited file lists each county once with its first neighbor
+    and leaves the county columns blank on the following neighbor rows.
+    Ids are positional, like ``queen_weights``. Returns ``None`` when the
+    file is missing or does not cover every FIPS code in ``gdf``.
+    """
+    if not adjacency_path.exists() or 'fips' not in gdf.columns:
+        return None
+
+    table = pd.read_csv(
+        adjacency_path, sep='\t', header=None, dtype=str, encoding='latin-1',
+        names=['county_name', 'fips', 'neighbor_name', 'neighbor_fips'],
+    )
+    table['fips'] = table['fips'].ffill()
+    table = table.dropna(subset=['neighbor_fips'])
+
+    position = pd.Series(np.arange(len(gdf)), index=gdf['fips'].astype(str).str.zfill(5))
+    if not position.index.isin(table['fips'].str.zfill(5)).all():
+        return None
+
+    left = position.reindex(table['fips'].str.zfill(5)).to_numpy()
+    right = position.reindex(table['neighbor_fips'].str.zfill(5)).to_numpy()
+    # Keep pairs where both counties are in the dataset; the table also lists
+    # each county as its own neighbor
+    keep = ~np.isnan(left) & ~np.isnan(right) & (left != right)
+
+    neighbors = {i: [] for i in range(len(gdf))}
+    for i, j in zip(left[keep].astype(int).tolist(), right[keep].astype(int).tolist()):
+        neighbors[i].append(j)
+    return W(neighbors)
+
+
+def cached_queen_weights(gdf: gpd.GeoDataFrame, cache_dir: Path) -> W:
+    """
+    Return Queen weights for ``gdf``, reusing a pickled neighbor dict when the
+    geometries are unchanged since the last run.
+
+    The cache key is a digest of the WKB-encoded geometry column, so any
+    upstream change to the boundaries triggers a rebuild.
+    """
+    digest = hashlib.blake2b(digest_size=16)
+    for wkb in shapely.to_wkb(gdf.geometry.values):
+        digest.update(wkb)
+    cache_path = cache_dir / f"queen_{digest.hexdigest()}.pkl"
+
+    if cache_path.exists():
+        with open(cache_path, 'rb') as f:
+            return W(pickle.load(f))
+
+    w = queen_weights(gdf)
+    cache_dir.mkdir(parents=True, exist_ok=True)
+    with open(cache_path, 'wb') as f:
+        pickle.dump(w.neighbors, f)
+    return w
+
+
+# Base seed for permutation inference. Each job's seed mixes in a hash of its
+# kind and output column, so reruns reproduce exactly and a column's seed (and
+# its ESDA result cache key) does not depend on which other jobs are queued.
+RNG_SEED = 20231101
+
+
+def job_seed(kind: str, column: str) -> int:
+    """Return the stable 32-bit permutation seed for one ESDA job."""
+    digest = hashlib.blake2b(f'{kind}:{column}'.encode(), digest_size=4).digest()
+    return RNG_SEED ^ int.from_bytes(digest, 'little')
+
+
+def esda_options(cls, seed: int, n_jobs: int) -> dict:
+    """
+    Return permutation keyword arguments supported by the installed ``cls``.
+
+    Only ``p_sim`` and the quadrant/Gi values are consulted, so the
+    ``(n, permutations)`` matrix of simulated statistics is not kept.
+    Options missing from older esda releases are dropped.
+    """
+    options = {
+        'permutations': 999,
+        'keep_simulations': False,
+        'n_jobs': n_jobs,
+        'seed': seed,
+    }
+    params = inspect.signature(cls).parameters
+    return {k: v for k, v in options.items() if k in params}
+
+
+def run_esda(cls, *inputs, seed: int, n_jobs: int):
+    """Construct ``cls(*inputs, **options)`` with seeded permutation inference."""
+    options = esda_options(cls, seed, n_jobs)
+    if 'seed' not in options:
+        # Older esda draws permutations from the global NumPy stream
+        np.random.seed(seed)
+    return cls(*inputs, **options)
+
+
+def compute_lisa(y: np.ndarray, neighbors: dict, seed: int, n_jobs: int = 1):
+    """Run a univariate LISA and return its pseudo p-values and quadrants."""
+    lisa = run_esda(Moran_Local, y, W(neighbors), seed=seed, n_jobs=n_jobs)
+    return lisa.p_sim, lisa.q
+
+
+def compute_bv_lisa(x: np.ndarray, y: np.ndarray, neighbors: dict, seed: int, n_jobs: int = 1):
+    """Run a bivariate LISA and return its pseudo p-values and quadrants."""
+    lisa_bv = run_esda(Moran_Local_BV, x, y, W(neighbors), seed=seed, n_jobs=n_jobs)
+    return lisa_bv.p_sim, lisa_bv.q
+
+
+def compute_hotspots(y: np.ndarray, neighbors: dict, seed: int, n_jobs: int = 1):
+    """Run Getis-Ord local G and return its pseudo p-values and Gi values."""
+    gi = run_esda(G_Local, y, W(neighbors), seed=seed, n_jobs=n_jobs)
+    # Get Gi* values for direction. z_sim only exists when simulations are
+    # kept; otherwise the direction is Gs relative to its analytical
+    # expectation EGs. That can differ from the permutation mean behind
+    # z_sim for counties whose Gs sits close to both, which are rarely
+    # significant, so labels may flip only at the margin.
+    if hasattr(gi, 'Gi'):
+        gi_values = gi.Gi
+    elif hasattr(gi, 'z_sim'):
+        gi_values = gi.z_sim
+    else:
+        gi_values = gi.Gs - gi.EGs
+    return gi.p_sim, gi_values
+
+
+def esda_cache_path(cache_dir: Path, column: str, func, args) -> Path:
+    """
+    Return the Parquet sidecar path for one ESDA job.
+
+    The key digests the statistic, the input arrays, the subset neighbor
+    dict and the seed, so a rebuilt input with identical values still hits
+    the cache while any change to the data or weights misses it.
+    """
+    digest = hashlib.blake2b(func.__name__.encode(), digest_size=16)
+    for arg in args:
+        if isinstance(arg, np.ndarray):
+            digest.update(np.ascontiguousarray(arg).tobytes())
+        elif isinstance(arg, dict):
+            digest.update(pickle.dumps(sorted(arg.items())))
+        else:
+            digest.update(repr(arg).encode())
+    return cache_dir / f"{column}_{digest.hexdigest()}.parquet"
+
+
+# Fixed label levels; code 0 is always "Not Significant"
+CLUSTER_LABELS = ['Not Significant', 'HH', 'LH', 'LL', 'HL']
+HOTSPOT_LABELS = [
+    'Not Significant',
+    'Hot Spot - 99% Conf', 'Cold Spot - 99% Conf',
+    'Hot Spot - 95% Conf', 'Cold Spot - 95% Conf',
+    'Hot Spot - 90% Conf', 'Cold Spot - 90% Conf',
+]
+
+
+def apply_cluster_labels(gdf, column, positions, p_sim, q) -> int:
+    """Write LISA quadrant labels for significant counties; return their count."""
+    # Quadrants 1-4 (HH, LH, LL, HL) map straight to label codes 1-4
+    sig = p_sim < 0.05
+    codes = np.zeros(len(gdf), dtype=np.int8)
+    codes[positions] = np.select([sig & (q == k) for k in (1, 2, 3, 4)], [1, 2, 3, 4], default=0)
+    gdf[column] = pd.Categorical.from_codes(codes, categories=CLUSTER_LABELS)
+    return int(sig.sum())
+
+
+# Hot spot label codes by confidence bucket (99/95/90/not significant) and
+# sign of Gi (cold, zero, hot)
+HOTSPOT_CODES = np.array([
+    [2, 0, 1],
+    [4, 0, 3],
+    [6, 0, 5],
+    [0, 0, 0],
+], dtype=np.int8)
+
+
+def apply_hotspot_labels(gdf, column, positions, p_sim, gi_values) -> None:
+    """Write hot/cold spot confidence labels for the valid counties."""
+    # Compare in p_sim's own dtype, as `p_sim < 0.01` would, so a float32
+    # p_sim of 0.01 stays in the 95% bucket
+    p_sim = np.asarray(p_sim)
+    bucket = np.digitize(p_sim, np.array([0.01, 0.05, 0.10], dtype=p_sim.dtype))
+    sign = np.sign(np.nan_to_num(gi_values)).astype(np.intp) + 1
+    codes = np.zeros(len(gdf), dtype=np.int8)
+    codes[positions] = HOTSPOT_CODES[bucket, sign]
+    gdf[column] = pd.Categorical.from_codes(codes, categories=HOTSPOT_LABELS)
+
+
+def apply_esda_result(gdf, kind, column, positions, p_sim, stat) -> None:
+    """Label ``gdf[column]`` from one finished ESDA job."""
+    if kind == 'hotspot':
+        apply_hotspot_labels(gdf, column, positions, p_sim, stat)
+        print(f"      ✅ {column}: hot spot analysis complete")
+    else:
+        n_sig = apply_cluster_labels(gdf, column, positions, p_sim, stat)
+        print(f"      ✅ {column}: {n_sig} significant clusters")
+
+
+def simplify_shared_borders(geoms: np.ndarray, tolerance: float) -> np.ndarray:
+    """
+    Simplify county outlines, simplifying each shared border only once.
+
+    Per-polygon simplification treats a border shared by two counties as two
+    independent lines, which opens slivers between neighbors. When the
+    optional ``topojson`` package is installed the shared arcs are extracted
+    and simplified once; otherwise fall back to per-polygon shapely.
+    """
+    try:
+        import topojson
+    except ImportError:
+        print("   topojson not installed, simplifying each polygon independently")
+        return shapely.simplify(geoms, tolerance, preserve_topology=True)
+
+    topo = topojson.Topology(gpd.GeoDataFrame(geometry=geoms), prequantize=True)
+    return np.asarray(topo.toposimplify(tolerance).to_gdf().geometry.values)
+
+
+def orient_rfc7946(geoms: np.ndarray) -> np.ndarray:
+    """Orient polygon rings per RFC 7946: exteriors counterclockwise, holes clockwise."""
+    if hasattr(shapely, 'orient_polygons'):
+        return shapely.orient_polygons(geoms)
+
+    # shapely < 2.1 only orients one Polygon at a time, so walk the parts
+    from shapely.geometry import MultiPolygon, Polygon
+    from shapely.geometry.polygon import orient
+
+    def orient_one(geom):
+        if isinstance(geom, Polygon):
+            return orient(geom, 1.0)
+        if isinstance(geom, MultiPolygon):
+            return MultiPolygon([orient(part, 1.0) for part in geom.geoms])
+        return geom
+
+    return np.array([orient_one(geom) for geom in geoms], dtype=object)
+
+
+def write_geojson(gdf: gpd.GeoDataFrame, path: Path) -> None:
+    """
+    Write ``gdf`` as an RFC 7946 FeatureCollection.
+
+    With the optional ``orjson`` package, geometries are encoded in one
+    vectorized ``shapely.to_geojson`` call and properties are serialized
+    from per-column lists, bypassing GDAL's feature-by-feature writer.
+    Otherwise the frame goes through pyogrio. Either way coordinates are
+    snapped to a 1e-5 degree grid first, so both writers emit the same
+    precision regardless of what the caller did.
+    """
+    geoms = shapely.set_precision(np.asarray(gdf.geometry.values), 1e-5)
+    gdf = gdf.set_geometry(gpd.GeoSeries(geoms, index=gdf.index, crs=gdf.crs))
+
+    try:
+        import orjson
+    except ImportError:
+        # GDAL's default 15 significant digits per coordinate are far beyond
+        # the ~1 m precision the map needs, and RFC 7946 output drops the
+        # legacy crs member and fixes ring winding. GDAL prints float32
+        # fields with spurious digits (50.880001), so widen them first.
+        float32_cols = gdf.select_dtypes(include=[np.float32]).columns
+        if len(float32_cols):
+            gdf[float32_cols] = gdf[float32_cols].astype(np.float64).round(2)
+        gdf.to_file(
+            path,
+            driver='GeoJSON',
+            engine='pyogrio',
+            layer_options={'COORDINATE_PRECISION': '5', 'RFC7946': 'YES'},
+        )
+        return
+
+    geometries = shapely.to_geojson(orient_rfc7946(geoms))
+
+    props = gdf.drop(columns=gdf.geometry.name)
+    columns = {}
+    for col in props.columns:
+        values = props[col]
+        if values.dtype == np.float32:
+            # Keep numpy scalars so orjson writes the shortest float32 repr
+            # (50.88) rather than the widened double (50.880001068115234)
+            objects = pd.Series(list(values.to_numpy()), index=values.index, dtype=object)
+        else:
+            objects = values.astype(object)
+        columns[col] = objects.where(values.notna(), None).tolist()
+
+    with open(path, 'wb') as f:
+        f.write(b'{"type":"FeatureCollection","features":[')
+        for i, geometry in enumerate(geometries):
+            if i:
+                f.write(b',')
+            f.write(b'{"type":"Feature","properties":')
+            f.write(orjson.dumps(
+                {col: values[i] for col, values in columns.items()},
+                option=orjson.OPT_SERIALIZE_NUMPY,
+            ))
+            f.write(b',"geometry":')
+            f.write(geometry.encode() if geometry is not None else b'null')
+            f.write(b'}')
+        f.write(b']}')
+
+
+def write_compressed_siblings(path: Path) -> list:
+    """
+    Write pre-compressed copies of ``path`` for Accept-Encoding negotiation.
+
+    A ``.gz`` sibling is always written; a ``.zst`` sibling is added when the
+    optional ``zstandard`` package is installed. Returns the written paths.
+    """
+    written = []
+    gz_path = path.with_name(path.name + '.gz')
+    # mtime=0 keeps the gzip header, and so the file, identical across runs
+    with open(path, 'rb') as src, gzip.GzipFile(gz_path, 'wb', compresslevel=9, mtime=0) as dst:
+        shutil.copyfileobj(src, dst)
+    written.append(gz_path)
+
+    try:
+        import zstandard
+    except ImportError:
+        print("   zstandard not installed, skipping .zst")
+        return written
+
+    zst_path = path.with_name(path.name + '.zst')
+    cctx = zstandard.ZstdCompressor(level=19, threads=-1)
+    with open(path, 'rb') as src, open(zst_path, 'wb') as dst:
+        cctx.copy_stream(src, dst)
+    written.append(zst_path)
+    return written
+
+
 # Paths
 project_root = Path(__file__).parent.parent
 data_processed = project_root / "data" / "processed"
+weights_cache = project_root / "data" / "interim" / "weights_cache"
+esda_cache = project_root / "data" / "interim" / "esda_cache"
+county_adjacency = project_root / "data" / "raw" / "census" / "county_adjacency.txt"
 web_assets = project_root / "web" / "assets"
 web_assets.mkdir(parents=True, exist_ok=True)
 
-print("=" * 80)
-print("ESDA Export for Web Visualization")
-print("=" * 80)
-
-# Load processed data
-print("\n1. Loading processed data...")
-gdf = gpd.read_file(data_processed / "counties_analysis.geojson")
-print(f"   Loaded {len(gdf)} counties")
-
-# Ensure NAME column exists (check alternatives)
-if 'NAME' not in gdf.columns:
-    if 'county_name' in gdf.columns:
-        gdf['NAME'] = gdf['county_name']
-    elif 'NAME' in gdf.columns.upper():
-        name_col = [c for c in gdf.columns if c.upper() == 'NAME'][0]
-        gdf['NAME'] = gdf[name_col]
-    else:
-        print("   Warning: No NAME column found, using FIPS as fallback")
-        gdf['NAME'] = gdf['fips']
-
-# Check if ESDA columns already exist
-needs_lisa = 'trump_share_2016_lisa_cluster' not in gdf.columns
-needs_bv = 'bv_cluster' not in gdf.columns
-needs_hotspot = 'trump_share_2016_hotspot_conf' not in gdf.columns
-
-if needs_lisa or needs_bv or needs_hotspot:
-    print("\n2. Computing spatial weights...")
-    w = Queen.from_dataframe(gdf, use_index=False)
-    print(f"   Created weights matrix: {w.n} counties")
-    
-    if needs_lisa:
-        print("\n3. Computing LISA clusters...")
-        for var in ['trump_share_2016', 'freq_phys_distress_pct']:
-            if var in gdf.columns:
-                # Subset to valid rows and align weights matrix
-                valid_mask = gdf[var].notna()
-                valid_indices = gdf.index[valid_mask]
-                
-                if len(valid_indices) > 100:
-                    print(f"   Computing LISA for {var} ({len(valid_indices)} valid counties)...")
+
+def main() -> None:
+    print("=" * 80)
+    print("ESDA Export for Web Visualization")
+    print("=" * 80)
+
+    # Load processed data
+    print("\n1. Loading processed data...")
+    gdf = gpd.read_file(data_processed / "counties_analysis.geojson")
+    print(f"   Loaded {len(gdf)} counties")
+
+    # Ensure NAME column exists (check alternatives)
+    if 'NAME' not in gdf.columns:
+        col_map = {c.upper(): c for c in gdf.columns}
+        if 'county_name' in gdf.columns:
+            gdf['NAME'] = gdf['county_name']
+        elif 'NAME' in col_map:
+            gdf['NAME'] = gdf[col_map['NAME']]
+        else:
+            print("   Warning: No NAME column found, using FIPS as fallback")
+            gdf['NAME'] = gdf['fips']
+
+    # Check if ESDA columns already exist
+    needs_lisa = 'trump_share_2016_lisa_cluster' not in gdf.columns
+    needs_bv = 'bv_cluster' not in gdf.columns
+    needs_hotspot = 'trump_share_2016_hotspot_conf' not in gdf.columns
+
+    if needs_lisa or needs_bv or needs_hotspot:
+        print("\n2. Computing spatial weights...")
+        # The Census adjacency table already lists every neighbor pair; derive
+        # Queen contiguity from the geometry only when it is unavailable
+        w = adjacency_weights(gdf, county_adjacency)
+        if w is not None:
+            print("   Using Census county adjacency table")
+        else:
+            w = cached_queen_weights(gdf, weights_cache)
+        print(f"   Created weights matrix: {w.n} counties")
+
+        # Every statistic below is independent of the others, so they are queued
+        # up front and their permutation inference runs in parallel processes.
+        # Each job carries the neighbor dict (W itself pickles poorly) and its own
+        # seed so the randomization stays reproducible.
+        jobs = []
+        job_variables = {}
+
+        def queue(kind, column, valid_mask, func, *arrays):
+            job_variables[column] = arrays
+            positions = np.flatnonzero(valid_mask)
+            w_valid = w_subset(w, positions.tolist())
+            args = (*(gdf[a].to_numpy()[positions] for a in arrays), w_valid.neighbors, job_seed(kind, column))
+            cache_path = esda_cache_path(esda_cache, column, func, args)
+            jobs.append((kind, column, positions, func, args, cache_path))
+
+        if needs_lisa:
+            print("\n3. Computing LISA clusters...")
+            for var in ['trump_share_2016', 'freq_phys_distress_pct']:
+                if var in gdf.columns:
+                    # Subset to valid rows and align weights matrix
+                    valid_mask = gdf[var].notna()
+                    if valid_mask.sum() > 100:
+                        print(f"   Computing LISA for {var} ({valid_mask.sum()} valid counties)...")
+                        queue('lisa', f'{var}_lisa_cluster', valid_mask, compute_lisa, var)
+
+        if needs_bv:
+            print("\n4. Computing bivariate LISA...")
+            if all(col in gdf.columns for col in ['freq_phys_distress_pct', 'trump_share_2016']):
+                # Subset to valid rows (both variables must be non-null)
+                valid_mask = gdf[['freq_phys_distress_pct', 'trump_share_2016']].notna().all(axis=1)
+                if valid_mask.sum() > 100:
+                    print(f"   Computing bivariate LISA: distress × Trump ({valid_mask.sum()} valid counties)...")
+                    queue('bv', 'bv_cluster', valid_mask, compute_bv_lisa,
+                          'freq_phys_distress_pct', 'trump_share_2016')
+
+        if needs_hotspot:
+            print("\n5. Computing hot spots (Getis-Ord Gi*)...")
+            for var in ['trump_share_2016', 'freq_phys_distress_pct']:
+                if var in gdf.columns:
+                    # Subset to valid rows and align weights matrix
+                    valid_mask = gdf[var].notna()
+                    if valid_mask.sum() > 100:
+                        print(f"   Computing hot spots for {var} ({valid_mask.sum()} valid counties)...")
+                        queue('hotspot', f'{var}_hotspot_conf', valid_mask, compute_hotspots, var)
+
+        # Reuse results from a previous run whose inputs hashed the same
+        pending = []
+        for kind, column, positions, func, args, cache_path in jobs:
+            if cache_path.exists():
+                cached = pd.read_parquet(cache_path)
+                print(f"   Reusing cached {column}")
+                apply_esda_result(gdf, kind, column, positions,
+                                  cached['p_sim'].to_numpy(), cached['stat'].to_numpy())
+            else:
+                pending.append((kind, column, positions, func, args, cache_path))
+
+        if pending:
+            print(f"\n   Running {len(pending)} ESDA jobs in parallel...")
+            # Split the cores between jobs; esda parallelizes the permutation
+            # chunks within each job up to that share.
+            cpus = os.cpu_count() or 1
+            n_jobs = max(1, cpus // len(pending))
+            esda_cache.mkdir(parents=True, exist_ok=True)
+            with ProcessPoolExecutor(max_workers=min(len(pending), cpus)) as executor:
+                futures = [executor.submit(func, *args, n_jobs) for _, _, _, func, args, _ in pending]
+                for (kind, column, positions, _, args, cache_path), future in zip(pending, futures):
                     try:
-                        # Create subset GeoDataFrame and weights matrix for valid rows only
-                        gdf_subset = gdf.loc[valid_indices].copy()
-                        w_subset = Queen.from_dataframe(gdf_subset, use_index=False)
-                        var_values = gdf_subset[var].values
-                        
-                        # Run LISA on subset
-                        lisa = Moran_Local(var_values, w_subset, permutations=999)
-                        
-                        # Initialize cluster column for all counties
-                        gdf[f'{var}_lisa_cluster'] = 'Not Significant'
-                        
-                        # Map results back to full dataframe using valid indices
-                        sig = lisa.p_sim < 0.05
-                        gdf.loc[valid_indices[sig & (lisa.q == 1)], f'{var}_lisa_cluster'] = 'HH'
-                        gdf.loc[valid_indices[sig & (lisa.q == 2)], f'{var}_lisa_cluster'] = 'LH'
-                        gdf.loc[valid_indices[sig & (lisa.q == 3)], f'{var}_lisa_cluster'] = 'LL'
-                        gdf.loc[valid_indices[sig & (lisa.q == 4)], f'{var}_lisa_cluster'] = 'HL'
-                        print(f"      ✅ {sig.sum()} significant clusters")
-                    except Exception as e:
-                        print(f"      ⚠️  Error: {e}")
-                        import traceback
-                        traceback.print_exc()
-    
-    if needs_bv:
-        print("\n4. Computing bivariate LISA...")
-        if all(col in gdf.columns for col in ['freq_phys_distress_pct', 'trump_share_2016']):
-            # Subset to valid rows (both variables must be non-null)
-            valid_mask = gdf[['freq_phys_distress_pct', 'trump_share_2016']].notna().all(axis=1)
-            valid_indices = gdf.index[valid_mask]
-            
-            if len(valid_indices) > 100:
-                print(f"   Computing bivariate LISA: distress × Trump ({len(valid_indices)} valid counties)...")
+                        p_sim, stat = future.result()
+                    except Exception:
+                        logger.exception(
+                            "ESDA job failed: kind=%s column=%s variables=%s counties=%d seed=%s",
+                            kind, column, ', '.join(job_variables[column]), len(positions), args[-1],
+                        )
+                        continue
+
+                    pd.DataFrame({
+                        'fips': gdf['fips'].to_numpy()[positions],
+                        'p_sim': p_sim,
+                        'stat': stat,
+                    }).to_parquet(cache_path, index=False)
+                    apply_esda_result(gdf, kind, column, positions, p_sim, stat)
+    else:
+        print("\n2-5. ESDA columns already exist, skipping computation...")
+
+    # Prepare export
+    print("\n6. Preparing web export...")
+    web_columns = [
+        'fips', 'NAME', 'geometry',
+        # Electoral
+        'trump_share_2016', 'trump_share_2020', 'trump_shift_16_20',
+        # Pain/distress metrics
+        'od_1316_rate', 'od_1720_rate', 'od_rate_change',
+        'freq_phys_distress_pct', 'freq_mental_distress_pct',
+        'arthritis_pct', 'depression_pct', 'diabetes_pct',
+        # LISA clusters
+        'trump_share_2016_lisa_cluster',
+        'freq_phys_distress_pct_lisa_cluster',
+        # Bivariate LISA
+        'bv_cluster',
+        # Hot spots
+        'trump_share_2016_hotspot_conf',
+        'freq_phys_distress_pct_hotspot_conf',
+        # Controls
+        'rucc', 'rural', 'rucc_category'
+    ]
+
+    # Filter to available columns
+    available_cols = [c for c in web_columns if c in gdf.columns]
+    missing_cols = [c for c in web_columns if c not in gdf.columns]
+
+    print(f"   Available columns: {len(available_cols)}/{len(web_columns)}")
+    if missing_cols:
+        print(f"   Missing columns: {missing_cols}")
+
+    web_gdf = gdf[available_cols].copy()
+
+    # Reproject, simplify and snap the raw geometry array as one chain of
+    # vectorized shapely calls, rebuilding the GeoSeries only at the end
+    print("\n7. Simplifying geometry...")
+    geoms = np.asarray(web_gdf.geometry.values)
+    if web_gdf.crs is not None and web_gdf.crs.to_epsg() != 4326:
+        to_wgs84 = Transformer.from_crs(web_gdf.crs, 'EPSG:4326', always_xy=True)
+        # shapely 2.0 only passes interleaved (N, 2) coordinate arrays
+        geoms = shapely.transform(
+            geoms, lambda xy: np.column_stack(to_wgs84.transform(xy[:, 0], xy[:, 1]))
+        )
+    try:
+        geoms = simplify_shared_borders(geoms, 0.01)
+        print("   ✅ Geometry simplified")
+    except Exception as e:
+        print(f"   ⚠️  Could not simplify: {e}")
+    # Snap vertices to a 1e-5 degree (~1 m) grid so exports diff cleanly; this
+    # runs even when simplification fails so GeoJSON and FGB keep one precision
+    geoms = shapely.set_precision(geoms, 1e-5)
+    web_gdf = web_gdf.set_geometry(gpd.GeoSeries(geoms, index=web_gdf.index, crs='EPSG:4326'))
+
+    # Convert categorical integers to integers BEFORE rounding (prevents any rounding)
+    categorical_int_cols = ['rucc', 'rural']  # fips is string, not numeric
+    print("\n8. Preserving categorical integers...")
+    for cat_col in categorical_int_cols:
+        if cat_col in web_gdf.columns:
+            # Convert to integer type (handles NaN with nullable Int64)
+            if web_gdf[cat_col].dtype in [np.float64, np.float32]:
+                web_gdf[cat_col] = web_gdf[cat_col].astype('Int64')
+                print(f"   ✅ Converted {cat_col} to integer")
+            elif not pd.api.types.is_integer_dtype(web_gdf[cat_col]):
+                # If somehow not numeric, try to convert
                 try:
-                    # Create subset GeoDataFrame and weights matrix for valid rows only
-                    gdf_subset = gdf.loc[valid_indices].copy()
-                    w_subset = Queen.from_dataframe(gdf_subset, use_index=False)
-                    var1_values = gdf_subset['freq_phys_distress_pct'].values
-                    var2_values = gdf_subset['trump_share_2016'].values
-                    
-                    # Run bivariate LISA on subset
-                    lisa_bv = Moran_Local_BV(var1_values, var2_values, w_subset, permutations=999)
-                    
-                    # Initialize cluster column for all counties
-                    gdf['bv_cluster'] = 'Not Significant'
-                    
-                    # Map results back to full dataframe using valid indices
-                    sig = lisa_bv.p_sim < 0.05
-                    gdf.loc[valid_indices[sig & (lisa_bv.q == 1)], 'bv_cluster'] = 'HH'
-                    gdf.loc[valid_indices[sig & (lisa_bv.q == 2)], 'bv_cluster'] = 'LH'
-                    gdf.loc[valid_indices[sig & (lisa_bv.q == 3)], 'bv_cluster'] = 'LL'
-                    gdf.loc[valid_indices[sig & (lisa_bv.q == 4)], 'bv_cluster'] = 'HL'
-                    print(f"      ✅ {sig.sum()} significant bivariate clusters")
-                except Exception as e:
-                    print(f"      ⚠️  Error: {e}")
-                    import traceback
-                    traceback.print_exc()
-    
-    if needs_hotspot:
-        print("\n5. Computing hot spots (Getis-Ord Gi*)...")
-        from esda import G_Local
-        for var in ['trump_share_2016', 'freq_phys_distress_pct']:
-            if var in gdf.columns:
-                # Subset to valid rows and align weights matrix
-                valid_mask = gdf[var].notna()
-                valid_indices = gdf.index[valid_mask]
-                
-                if len(valid_indices) > 100:
-                    print(f"   Computing hot spots for {var} ({len(valid_indices)} valid counties)...")
-                    try:
-                        # Create subset GeoDataFrame and weights matrix for valid rows only
-                        gdf_subset = gdf.loc[valid_indices].copy()
-                        w_subset = Queen.from_dataframe(gdf_subset, use_index=False)
-                        var_values = gdf_subset[var].values
-                        
-                        # Run hot spot analysis on subset
-                        gi = G_Local(var_values, w_subset, permutations=999)
-                        
-                        # Initialize hotspot column for all counties
-                        gdf[f'{var}_hotspot_conf'] = 'Not Significant'
-                        
-                        # Get Gi* values (use Gi attribute or z_sim for direction)
-                        gi_values = gi.Gi if hasattr(gi, 'Gi') else gi.z_sim
-                        
-                        # Map results back to full dataframe using valid indices
-                        # 99% confidence
-                        sig_99 = gi.p_sim < 0.01
-                        gdf.loc[valid_indices[sig_99 & (gi_values > 0)], f'{var}_hotspot_conf'] = 'Hot Spot - 99% Conf'
-                        gdf.loc[valid_indices[sig_99 & (gi_values < 0)], f'{var}_hotspot_conf'] = 'Cold Spot - 99% Conf'
-                        # 95% confidence
-                        sig_95 = (gi.p_sim < 0.05) & (gi.p_sim >= 0.01)
-                        gdf.loc[valid_indices[sig_95 & (gi_values > 0)], f'{var}_hotspot_conf'] = 'Hot Spot - 95% Conf'
-                        gdf.loc[valid_indices[sig_95 & (gi_values < 0)], f'{var}_hotspot_conf'] = 'Cold Spot - 95% Conf'
-                        # 90% confidence
-                        sig_90 = (gi.p_sim < 0.10) & (gi.p_sim >= 0.05)
-                        gdf.loc[valid_indices[sig_90 & (gi_values > 0)], f'{var}_hotspot_conf'] = 'Hot Spot - 90% Conf'
-                        gdf.loc[valid_indices[sig_90 & (gi_values < 0)], f'{var}_hotspot_conf'] = 'Cold Spot - 90% Conf'
-                        print(f"      ✅ Hot spot analysis complete")
-                    except Exception as e:
-                        print(f"      ⚠️  Error: {e}")
-                        import traceback
-                        traceback.print_exc()
-else:
-    print("\n2-5. ESDA columns already exist, skipping computation...")
-
-# Prepare export
-print("\n6. Preparing web export...")
-web_columns = [
-    'fips', 'NAME', 'geometry',
-    # Electoral
-    'trump_share_2016', 'trump_share_2020', 'trump_shift_16_20',
-    # Pain/distress metrics
-    'od_1316_rate', 'od_1720_rate', 'od_rate_change',
-    'freq_phys_distress_pct', 'freq_mental_distress_pct',
-    'arthritis_pct', 'depression_pct', 'diabetes_pct',
-    # LISA clusters
-    'trump_share_2016_lisa_cluster',
-    'freq_phys_distress_pct_lisa_cluster',
-    # Bivariate LISA
-    'bv_cluster',
-    # Hot spots
-    'trump_share_2016_hotspot_conf',
-    'freq_phys_distress_pct_hotspot_conf',
-    # Controls
-    'rucc', 'rural', 'rucc_category'
-]
+                    web_gdf[cat_col] = pd.to_numeric(web_gdf[cat_col], errors='coerce').astype('Int64')
+                    print(f"   ✅ Converted {cat_col} to integer")
+                except:
+                    print(f"   ⚠️  Could not convert {cat_col} to integer")
 
-# Filter to available columns
-available_cols = [c for c in web_columns if c in gdf.columns]
-missing_cols = [c for c in web_columns if c not in gdf.columns]
+    # Round numeric columns (exclude categorical integers and all integer types)
+    print("\n9. Rounding continuous numeric columns...")
+    # Only round float columns, never integer columns (including Int64)
+    float_cols = web_gdf.select_dtypes(include=[np.float64, np.float32]).columns
+    # Also exclude categorical integer fields by name (double safety)
+    cols_to_round = [c for c in float_cols if c not in categorical_int_cols]
+    if cols_to_round:
+        web_gdf[cols_to_round] = web_gdf[cols_to_round].round(2)
+        print(f"   ✅ Rounded {len(cols_to_round)} float columns")
+    else:
+        print("   ⚠️  No float columns to round")
+
+    # Two decimals need at most ~5 significant digits, well within float32,
+    # and RUCC codes (1-9) and the rural flag fit in Int8
+    if cols_to_round:
+        web_gdf[cols_to_round] = web_gdf[cols_to_round].astype(np.float32)
+    for cat_col in categorical_int_cols:
+        if cat_col in web_gdf.columns and pd.api.types.is_integer_dtype(web_gdf[cat_col]):
+            web_gdf[cat_col] = web_gdf[cat_col].astype('Int8')
+    print("   ✅ Downcast numeric columns to float32/Int8")
 
-print(f"   Available columns: {len(available_cols)}/{len(web_columns)}")
-if missing_cols:
-    print(f"   Missing columns: {missing_cols}")
+    # Export
+    output_path = web_assets / "counties_esda.geojson"
+    print(f"\n10. Exporting to {output_path}...")
+    write_geojson(web_gdf, output_path)
+    file_size_mb = output_path.stat().st_size / (1024 * 1024)
+    print(f"   ✅ Exported {len(web_gdf)} counties ({file_size_mb:.1f} MB)")
 
-web_gdf = gdf[available_cols].copy()
+    # FlatGeobuf with a packed Hilbert R-tree lets the browser fetch only the
+    # features in the current viewport via HTTP range requests.
+    fgb_path = web_assets / "counties_esda.fgb"
+    print(f"\n11. Exporting to {fgb_path}...")
+    web_gdf.to_file(fgb_path, driver='FlatGeobuf', engine='pyogrio', SPATIAL_INDEX='YES')
+    print(f"   ✅ Exported FlatGeobuf ({fgb_path.stat().st_size / (1024 * 1024):.1f} MB)")
 
-# Ensure CRS is WGS84
-if web_gdf.crs is None or web_gdf.crs.to_epsg() != 4326:
-    if web_gdf.crs is not None:
-        web_gdf = web_gdf.to_crs('EPSG:4326')
+    # Zoom-aware vector tiles, when tippecanoe is installed
+    pmtiles_path = web_assets / "counties_esda.pmtiles"
+    if shutil.which('tippecanoe'):
+        print(f"\n12. Tiling to {pmtiles_path}...")
+        try:
+            subprocess.run(
+                ['tippecanoe', '-o', str(pmtiles_path), '--projection=EPSG:4326',
+                 '--layer=counties', '--force', str(output_path)],
+                check=True,
+            )
+            print(f"   ✅ Exported PMTiles ({pmtiles_path.stat().st_size / (1024 * 1024):.1f} MB)")
+        except subprocess.CalledProcessError as e:
+            print(f"   ⚠️  tippecanoe failed: {e}")
     else:
-        web_gdf = web_gdf.set_crs('EPSG:4326')
-
-# Simplify geometry
-print("\n7. Simplifying geometry...")
-try:
-    web_gdf['geometry'] = web_gdf['geometry'].simplify(0.01, preserve_topology=True)
-    print("   ✅ Geometry simplified")
-except Exception as e:
-    print(f"   ⚠️  Could not simplify: {e}")
-
-# Convert categorical integers to integers BEFORE rounding (prevents any rounding)
-categorical_int_cols = ['rucc', 'rural']  # fips is string, not numeric
-print("\n8. Preserving categorical integers...")
-for cat_col in categorical_int_cols:
-    if cat_col in web_gdf.columns:
-        # Convert to integer type (handles NaN with nullable Int64)
-        if web_gdf[cat_col].dtype in [np.float64, np.float32]:
-            web_gdf[cat_col] = web_gdf[cat_col].astype('Int64')
-            print(f"   ✅ Converted {cat_col} to integer")
-        elif not pd.api.types.is_integer_dtype(web_gdf[cat_col]):
-            # If somehow not numeric, try to convert
-            try:
-                web_gdf[cat_col] = pd.to_numeric(web_gdf[cat_col], errors='coerce').astype('Int64')
-                print(f"   ✅ Converted {cat_col} to integer")
-            except:
-                print(f"   ⚠️  Could not convert {cat_col} to integer")
-
-# Round numeric columns (exclude categorical integers and all integer types)
-print("\n9. Rounding continuous numeric columns...")
-# Only round float columns, never integer columns (including Int64)
-float_cols = web_gdf.select_dtypes(include=[np.float64, np.float32]).columns
-# Also exclude categorical integer fields by name (double safety)
-cols_to_round = [c for c in float_cols if c not in categorical_int_cols]
-if cols_to_round:
-    web_gdf[cols_to_round] = web_gdf[cols_to_round].round(2)
-    print(f"   ✅ Rounded {len(cols_to_round)} float columns")
-else:
-    print("   ⚠️  No float columns to round")
-
-# Export
-output_path = web_assets / "counties_esda.geojson"
-print(f"\n10. Exporting to {output_path}...")
-web_gdf.to_file(output_path, driver='GeoJSON')
-file_size_mb = output_path.stat().st_size / (1024 * 1024)
-print(f"   ✅ Exported {len(web_gdf)} counties ({file_size_mb:.1f} MB)")
-
-# Summary
-print("\n" + "=" * 80)
-print("Export Summary")
-print("=" * 80)
-print(f"Counties: {len(web_gdf)}")
-print(f"Columns: {len(available_cols)}")
-print(f"File size: {file_size_mb:.1f} MB")
-print(f"Output: {output_path}")
-print("=" * 80)
+        print("\n12. tippecanoe not found, skipping PMTiles export")
+
+    # Pre-compressed GeoJSON for hosts that serve by Accept-Encoding
+    print("\n13. Compressing GeoJSON...")
+    compressed_paths = write_compressed_siblings(output_path)
+    for compressed_path in compressed_paths:
+        print(f"   ✅ {compressed_path.name} ({compressed_path.stat().st_size / (1024 * 1024):.1f} MB)")
+
+    # Summary
+    print("\n" + "=" * 80)
+    print("Export Summary")
+    print("=" * 80)
+    print(f"Counties: {len(web_gdf)}")
+    print(f"Columns: {len(available_cols)}")
+    print(f"File size: {file_size_mb:.1f} MB")
+    print(f"Output: {output_path}")
+    print(f"FlatGeobuf: {fgb_path}")
+    if pmtiles_path.exists():
+        print(f"PMTiles: {pmtiles_path}")
+    for compressed_path in compressed_paths:
+        print(f"Compressed: {compressed_path}")
+    print("=" * 80)
+
 
+if __name__ == "__main__":
+    main()
@@ -5,9 +5,16 @@ Process CDC WONDER data from CSV to tab-delimited format expected by pipeline.
 Converts the downloaded CSV file to the format expected by the data loaders.
 """
 
+import csv
+import os
+import shutil
 import sys
 from pathlib import Path
-import pandas as pd
+
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.csv as pacsv
+import pyarrow.parquet as pq
 
 sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
 from pain_politics.config import paths
@@ -15,6 +22,38 @@ from pain_politics.utils import get_logger
 
 logger = get_logger(__name__)
 
+NUMERIC_COLUMNS = ['Deaths', 'Population', 'Age Adjusted Rate']
+
+# Placeholders CDC WONDER writes in place of suppressed or unstable values
+SUPPRESSION_MARKERS = ['', 'NA', 'Unreliable', 'Suppressed', 'Missing', 'Not Applicable']
+
+# Plain decimal or scientific notation; anything else (e.g. "Unreliable",
+# "Suppressed") becomes null, matching pd.to_numeric(errors='coerce')
+NUMBER_PATTERN = r'^\s*[-+]?(\d+\.?\d*|\.\d+)([eE][-+]?\d+)?\s*$'
+
+
+def contains_total(county: pa.ChunkedArray) -> pa.ChunkedArray:
+    """
+    Flag County values containing "Total" (case-insensitive); nulls are False.
+
+    The substring match runs once per distinct name on each chunk's
+    dictionary, and the result is broadcast back through the indices.
+    """
+    chunks = []
+    for chunk in county.cast(pa.string()).chunks:
+        encoded = chunk.dictionary_encode()
+        # Arrow implements ignore_case matching with RE2; lowering first keeps
+        # this on the plain substring search
+        is_total = pc.match_substring(pc.utf8_lower(encoded.dictionary), 'total')
+        chunks.append(pc.fill_null(pc.take(is_total, encoded.indices), False))
+    return pa.chunked_array(chunks, type=pa.bool_())
+
+
+def to_float(values: pa.ChunkedArray) -> pa.ChunkedArray:
+    """Cast a string column to float64, nulling entries that are not numbers."""
+    is_number = pc.fill_null(pc.match_substring_regex(values, NUMBER_PATTERN), False)
+    return pc.cast(pc.if_else(is_number, values, None), pa.float64())
+
 
 def process_cdc_wonder_file(input_file: Path, output_prefix: str = None):
     """
@@ -24,42 +63,69 @@ def process_cdc_wonder_file(input_file: Path, output_prefix: str = None):
         input_file: Path to the downloaded CSV file
         output_prefix: Optional prefix for output files (default: use input filename)
     """
-    logger.info(f"Processing CDC WONDER file: {input_file}")
+    logger.info("Processing CDC WONDER file: %s", input_file)
     
     try:
-        # Read the CSV file
-        df = pd.read_csv(input_file)
-        logger.info(f"  Loaded {len(df):,} rows")
-        logger.info(f"  Columns: {list(df.columns)}")
+        with open(input_file, newline='', encoding='utf-8-sig') as f:
+            header = next(csv.reader(f))
+        logger.info("  Columns: %s", header)
         
-        # Clean up the data
-        # Remove any rows with "Total" in County (footer rows)
-        df = df[~df['County'].str.contains('Total', case=False, na=False)]
+        # Parse only the columns that survive cleanup (WONDER exports also
+        # carry Notes and code columns). Codes are read as text so they keep
+        # their leading zeros; counts and rates are typed during the parse,
+        # with WONDER's suppression markers read as null.
+        rate_column = 'Crude Rate' if 'Crude Rate' in header else 'Age Adjusted Rate'
+        source_columns = ['County', 'County Code', 'Deaths', 'Population', rate_column]
+        text_types = {col: pa.string() for col in source_columns}
+        numeric_types = {col: pa.float64() for col in ('Deaths', 'Population', rate_column)}
+        
+        def read_columns(column_types, null_values=None):
+            options = pacsv.ConvertOptions(
+                include_columns=[col for col in source_columns if col in header],
+                column_types=column_types,
+                strings_can_be_null=True,
+            )
+            if null_values is not None:
+                options.null_values = null_values
+            # WONDER appends a "---" separator and one-cell notes rows
+            # ("Dataset: ...", "Query Parameters: ...") after the data; skip
+            # any row whose column count does not match the header
+            parse_options = pacsv.ParseOptions(invalid_row_handler=lambda row: 'skip')
+            return pacsv.read_csv(input_file, parse_options=parse_options, convert_options=options)
+        
+        try:
+            table = read_columns({**text_types, **numeric_types}, SUPPRESSION_MARKERS)
+        except pa.ArrowInvalid:
+            # Some other non-numeric value; read as text and coerce below
+            table = read_columns(text_types)
+        logger.info("  Loaded %s rows", f"{table.num_rows:,}")
         
         # Rename columns to match expected format
         column_mapping = {
             'Crude Rate': 'Age Adjusted Rate',
         }
-        df = df.rename(columns=column_mapping)
+        table = table.rename_columns([column_mapping.get(c, c) for c in table.column_names])
         
         # Keep only needed columns
         needed_columns = ['County', 'County Code', 'Deaths', 'Population', 'Age Adjusted Rate']
-        missing_cols = [col for col in needed_columns if col not in df.columns]
+        missing_cols = [col for col in needed_columns if col not in table.column_names]
         if missing_cols:
-            logger.warning(f"  Missing columns: {missing_cols}")
+            logger.warning("  Missing columns: %s", missing_cols)
         
-        df_clean = df[needed_columns].copy()
+        table = table.select(needed_columns)
         
-        # Convert numeric columns
-        for col in ['Deaths', 'Population', 'Age Adjusted Rate']:
-            # Handle "Unreliable" values
-            df_clean[col] = df_clean[col].replace('Unreliable', pd.NA)
-            df_clean[col] = pd.to_numeric(df_clean[col], errors='coerce')
+        # Clean up the data in a single filter pass, before any casts:
+        # drop rows with "Total" in County (footer rows) and rows with a
+        # missing County Code
+        keep = pc.and_(pc.invert(contains_total(table['County'])), pc.is_valid(table['County Code']))
+        table = table.filter(keep)
         
-        # Remove rows with missing County Code
-        df_clean = df_clean.dropna(subset=['County Code'])
+        # Coerce numeric columns still held as text (handles "Unreliable" values)
+        for col in NUMERIC_COLUMNS:
+            if not pa.types.is_floating(table[col].type):
+                table = table.set_column(table.column_names.index(col), col, to_float(table[col]))
         
-        logger.info(f"  Cleaned data: {len(df_clean):,} rows")
+        logger.info("  Cleaned data: %s rows", f"{table.num_rows:,}")
         
         # Create both output files
         # (The loader will aggregate by FIPS, so the same data works for both periods)
@@ -68,14 +134,29 @@ def process_cdc_wonder_file(input_file: Path, output_prefix: str = None):
             paths.data_raw / "cdc_wonder" / "overdose_2017_2020.txt",
         ]
         
-        for output_file in output_files:
+        # Serialize once, as tab-delimited text plus a Parquet twin that the
+        # loaders read in preference; the other periods are hard links (or
+        # copies on filesystems without link support) of the first files
+        first_file, *other_files = output_files
+        first_file.parent.mkdir(parents=True, exist_ok=True)
+        pacsv.write_csv(table, first_file, pacsv.WriteOptions(delimiter='\t', quoting_style='needed'))
+        pq.write_table(table, first_file.with_suffix('.parquet'), compression='snappy', use_dictionary=True)
+        logger.info("  ✅ Created: %s (+ .parquet)", first_file)
+        
+        for output_file in other_files:
             output_file.parent.mkdir(parents=True, exist_ok=True)
-            df_clean.to_csv(output_file, sep='\t', index=False)
-            logger.info(f"  ✅ Created: {output_file}")
+            for source, target in [(first_file, output_file),
+                                   (first_file.with_suffix('.parquet'), output_file.with_suffix('.parquet'))]:
+                target.unlink(missing_ok=True)
+                try:
+                    os.link(source, target)
+                except OSError:
+                    shutil.copyfile(source, target)
+            logger.info("  ✅ Created: %s (+ .parquet)", output_file)
         
         logger.info("")
         logger.info("✅ CDC WONDER data processing complete!")
-        logger.info(f"   Created {len(output_files)} files with {len(df_clean):,} counties each")
+        logger.info("   Created %s files with %s counties each", len(output_files), f"{table.num_rows:,}")
         logger.info("")
         logger.info("Note: Both files contain the same aggregated data since your")
         logger.info("      download covered all years. The pipeline will handle this correctly.")
@@ -83,7 +164,7 @@ def process_cdc_wonder_file(input_file: Path, output_prefix: str = None):
         return 0
         
     except Exception as e:
-        logger.error(f"❌ Error processing file: {e}")
+        logger.error("❌ Error processing file: %s", e)
         import traceback
         traceback.print_exc()
         return 1
@@ -101,14 +182,14 @@ def main():
             # Try relative to cdc_wonder directory
             input_file = cdc_wonder_dir / sys.argv[1]
             if not input_file.exists():
-                logger.error(f"❌ File not found: {sys.argv[1]}")
+                logger.error("❌ File not found: %s", sys.argv[1])
                 return 1
     else:
         # Look for CSV files in cdc_wonder directory
         csv_files = list(cdc_wonder_dir.glob("*.csv"))
         
         if not csv_files:
-            logger.error(f"❌ No CSV files found in {cdc_wonder_dir}")
+            logger.error("❌ No CSV files found in %s", cdc_wonder_dir)
             logger.info("")
             logger.info("Please provide the path to your CDC WONDER download:")
             logger.info("  python scripts/process_cdc_wonder.py <filename>")
@@ -116,11 +197,11 @@ def main():
         
         if len(csv_files) == 1:
             input_file = csv_files[0]
-            logger.info(f"Found CDC WONDER file: {input_file.name}")
+            logger.info("Found CDC WONDER file: %s", input_file.name)
         else:
-            logger.info(f"Found multiple CSV files in {cdc_wonder_dir}:")
+            logger.info("Found multiple CSV files in %s:", cdc_wonder_dir)
             for f in csv_files:
-                logger.info(f"  - {f.name}")
+                logger.info("  - %s", f.name)
             logger.info("")
             logger.info("Please specify which file to process:")
             logger.info("  python scripts/process_cdc_wonder.py <filename>")
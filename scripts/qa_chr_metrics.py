@@ -16,6 +16,7 @@ SRC_PATH = PROJECT_ROOT / "src"
 if str(SRC_PATH) not in sys.path:
     sys.path.insert(0, str(SRC_PATH))
 
+import numpy as np  # noqa: E402
 import pandas as pd  # noqa: E402
 
 from pain_politics.data.loaders import load_county_health_rankings  # noqa: E402
@@ -23,14 +24,20 @@ from pain_politics.data.loaders import load_county_health_rankings  # noqa: E402
 
 def summarize(series: pd.Series) -> dict[str, float]:
     """Return a compact summary dictionary for QA output."""
-    numeric = pd.to_numeric(series, errors="coerce")
+    values = pd.to_numeric(series, errors="coerce").to_numpy(dtype=np.float64, na_value=np.nan)
+    valid = values[~np.isnan(values)]
+    if not valid.size:
+        nan = float("nan")
+        return {"count": 0, "mean": nan, "p10": nan, "p90": nan, "min": nan, "max": nan}
+
+    p10, p90 = np.percentile(valid, [10, 90])
     return {
-        "count": int(numeric.count()),
-        "mean": float(numeric.mean()) if numeric.count() else float("nan"),
-        "p10": float(numeric.quantile(0.10)) if numeric.count() else float("nan"),
-        "p90": float(numeric.quantile(0.90)) if numeric.count() else float("nan"),
-        "min": float(numeric.min()) if numeric.count() else float("nan"),
-        "max": float(numeric.max()) if numeric.count() else float("nan"),
+        "count": int(valid.size),
+        "mean": float(valid.mean()),
+        "p10": float(p10),
+        "p90": float(p90),
+        "min": float(valid.min()),
+        "max": float(valid.max()),
     }
 
 
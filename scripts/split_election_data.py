@@ -8,9 +8,15 @@ https://dataverse.harvard.edu/dataset.xhtml?persistentId=doi:10.7910/DVN/VOQCHQ
 Place it in data/raw/elections/ and run this script to split it.
 """
 
+import csv
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-import pandas as pd
+
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.csv as pacsv
+import pyarrow.parquet as pq
 
 # Add src to path
 sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
@@ -45,15 +51,15 @@ def split_election_data(input_file: Path = None):
             # List all CSV files in directory
             csv_files = list(elections_dir.glob('*.csv'))
             if csv_files:
-                logger.info(f"Found CSV files in {elections_dir}:")
+                logger.info("Found CSV files in %s:", elections_dir)
                 for f in csv_files:
-                    logger.info(f"  - {f.name}")
+                    logger.info("  - %s", f.name)
                 logger.info("")
                 logger.info("If one of these is the MIT Election Lab file, rename it or provide the path:")
-                logger.info(f"  python scripts/split_election_data.py <filename>")
+                logger.info("  python scripts/split_election_data.py <filename>")
                 return 1
             else:
-                logger.error(f"❌ No election data file found in {elections_dir}")
+                logger.error("❌ No election data file found in %s", elections_dir)
                 logger.info("")
                 logger.info("Please download from:")
                 logger.info("  https://dataverse.harvard.edu/dataset.xhtml?persistentId=doi:10.7910/DVN/VOQCHQ")
@@ -62,57 +68,109 @@ def split_election_data(input_file: Path = None):
                 logger.info("Then run this script again.")
                 return 1
     
-    logger.info(f"Reading election data from: {input_file}")
+    logger.info("Reading election data from: %s", input_file)
+    
+    file_2016 = paths.data_raw / 'elections' / 'county_presidential_2016.csv'
+    file_2020 = paths.data_raw / 'elections' / 'county_presidential_2020.csv'
+    outputs = {'2016': file_2016, '2020': file_2020}
+    partial = {year: path.with_name(path.name + '.part') for year, path in outputs.items()}
+    partial_parquet = {year: path.with_name(path.stem + '.parquet.part') for year, path in outputs.items()}
+    writers = {}
+    parquet_writers = {}
     
     try:
-        df = pd.read_csv(input_file)
-        logger.info(f"  Loaded {len(df):,} rows")
-        logger.info(f"  Years available: {sorted(df['year'].unique())}")
+        with open(input_file, newline='') as f:
+            header = next(csv.reader(f))
         
         # Check for required columns
         required_cols = ['year', 'state', 'county_name', 'county_fips', 'candidate', 'party', 'candidatevotes', 'totalvotes']
-        missing_cols = [col for col in required_cols if col not in df.columns]
+        missing_cols = [col for col in required_cols if col not in header]
         if missing_cols:
-            logger.warning(f"⚠️  Missing expected columns: {missing_cols}")
-            logger.info(f"  Available columns: {list(df.columns)}")
+            logger.warning("⚠️  Missing expected columns: %s", missing_cols)
+            logger.info("  Available columns: %s", header)
         
-        # Split by year
-        df_2016 = df[df['year'] == 2016].copy()
-        df_2020 = df[df['year'] == 2020].copy()
+        # Stream the file in large blocks and route each block's 2016/2020
+        # rows straight to their writers, so the other years are never held
+        # in memory. Columns are read as text and written back verbatim.
+        reader = pacsv.open_csv(
+            input_file,
+            read_options=pacsv.ReadOptions(block_size=64 << 20),
+            convert_options=pacsv.ConvertOptions(column_types={col: pa.string() for col in header}),
+        )
+        write_options = pacsv.WriteOptions(quoting_style='needed')
+        file_2016.parent.mkdir(parents=True, exist_ok=True)
+        for year, path in partial.items():
+            writers[year] = pacsv.CSVWriter(path, reader.schema, write_options=write_options)
+            # Parquet twin that the loaders read in preference to the CSV
+            parquet_writers[year] = pq.ParquetWriter(
+                partial_parquet[year], reader.schema, compression='snappy', use_dictionary=True
+            )
         
-        if len(df_2016) == 0:
-            logger.error("❌ No data found for year 2016")
-            return 1
+        n_rows = 0
+        counts = dict.fromkeys(outputs, 0)
+        years = set()
+        wanted = pa.array(list(outputs))
+        # Arrow's writers release the GIL, so the four sinks (CSV + Parquet
+        # for each year) encode and write each batch concurrently
+        with ThreadPoolExecutor(max_workers=2 * len(outputs)) as pool:
+            for batch in reader:
+                n_rows += batch.num_rows
+                years.update(pc.unique(batch['year']).to_pylist())
+                # One scan of the year strings yields each row's output slot (or
+                # null); the per-year masks then compare small integers
+                slot = pc.fill_null(pc.index_in(batch['year'], value_set=wanted), -1)
+                pending = []
+                for k, year in enumerate(outputs):
+                    subset = batch.filter(pc.equal(slot, k))
+                    counts[year] += subset.num_rows
+                    pending.append(pool.submit(writers[year].write_batch, subset))
+                    pending.append(pool.submit(parquet_writers[year].write_batch, subset))
+                for future in pending:
+                    future.result()
         
-        if len(df_2020) == 0:
-            logger.error("❌ No data found for year 2020")
-            return 1
+        for writer in (*writers.values(), *parquet_writers.values()):
+            writer.close()
+        logger.info("  Loaded %s rows", f"{n_rows:,}")
+        logger.info("  Years available: %s", sorted(y for y in years if y is not None))
         
-        # Save files
-        file_2016 = paths.data_raw / 'elections' / 'county_presidential_2016.csv'
-        file_2020 = paths.data_raw / 'elections' / 'county_presidential_2020.csv'
+        for year, count in counts.items():
+            if count == 0:
+                logger.error("❌ No data found for year %s", year)
+                return 1
         
-        df_2016.to_csv(file_2016, index=False)
-        df_2020.to_csv(file_2020, index=False)
+        # Save files
+        for year, path in outputs.items():
+            partial[year].replace(path)
+            partial_parquet[year].replace(path.with_suffix('.parquet'))
         
         logger.info("")
         logger.info("✅ Successfully split election data:")
-        logger.info(f"  2016: {len(df_2016):,} rows → {file_2016}")
-        logger.info(f"  2020: {len(df_2020):,} rows → {file_2020}")
+        logger.info("  2016: %s rows → %s", f"{counts['2016']:,}", file_2016)
+        logger.info("  2020: %s rows → %s", f"{counts['2020']:,}", file_2020)
+        logger.info("  (with .parquet twins alongside each CSV)")
         logger.info("")
         
         # Optionally delete the original file
         if input_file.name.startswith('countypres_2000'):
-            logger.info(f"You can now delete the original file: {input_file}")
+            logger.info("You can now delete the original file: %s", input_file)
             logger.info("  (The 2016 and 2020 files have been extracted)")
         
         return 0
         
     except Exception as e:
-        logger.error(f"❌ Error processing file: {e}")
+        logger.error("❌ Error processing file: %s", e)
         import traceback
         traceback.print_exc()
         return 1
+    
+    finally:
+        for writer in (*writers.values(), *parquet_writers.values()):
+            try:
+                writer.close()
+            except Exception:
+                pass
+        for path in (*partial.values(), *partial_parquet.values()):
+            path.unlink(missing_ok=True)
 
 
 def main():
@@ -125,7 +183,7 @@ def main():
             # Try relative to elections directory
             input_file = paths.data_raw / 'elections' / sys.argv[1]
             if not input_file.exists():
-                logger.error(f"❌ File not found: {sys.argv[1]}")
+                logger.error("❌ File not found: %s", sys.argv[1])
                 return 1
     
     return split_election_data(input_file)
@@ -1,15 +1,20 @@
+from pathlib import Path
+
 from setuptools import setup, find_packages
 
+
+def _requirements():
+    """Return requirement specifiers from requirements.txt, minus comments."""
+    text = Path(__file__).parent.joinpath("requirements.txt").read_text(encoding="utf-8")
+    specs = (line.split("#", 1)[0].strip() for line in text.splitlines())
+    return [spec for spec in specs if spec]
+
+
 setup(
     name="pain_politics",
     version="0.1.0",
     package_dir={"": "src"},
     packages=find_packages(where="src"),
     python_requires=">=3.11",
-    install_requires=[
-        line.strip()
-        for line in open("requirements.txt").readlines()
-        if line.strip() and not line.startswith("#")
-    ],
+    install_requires=_requirements(),
 )
-
@@ -7,8 +7,6 @@ import json
 from pathlib import Path
 
 from .config import paths
-from .data import DataCatalog
-from .pipeline import build_analysis_dataset
 from .utils import get_logger
 
 
@@ -22,9 +20,11 @@ def build_parser() -> argparse.ArgumentParser:
     )
     subparsers = parser.add_subparsers(dest="command")
 
-    subparsers.add_parser("catalog", help="List required raw datasets and their status.")
+    catalog_parser = subparsers.add_parser("catalog", help="List required raw datasets and their status.")
+    catalog_parser.set_defaults(func=run_catalog)
 
     build_parser = subparsers.add_parser("build-data", help="Build the analysis GeoJSON file.")
+    build_parser.set_defaults(func=run_build_data)
     build_parser.add_argument(
         "--sample",
         action="store_true",
@@ -40,23 +40,38 @@ def build_parser() -> argparse.ArgumentParser:
     return parser
 
 
+# Subcommand handlers import their dependencies on demand so that `--help`
+# and `catalog` don't pay for pandas/geopandas at startup.
+
+
+def run_catalog(parsed: argparse.Namespace) -> None:
+    from .data import DataCatalog
+
+    catalog = DataCatalog()
+    catalog.log_summary()
+    print(json.dumps(catalog.summary(), indent=2))
+
+
+def run_build_data(parsed: argparse.Namespace) -> None:
+    from .pipeline import build_analysis_dataset
+
+    result = build_analysis_dataset(output_path=parsed.output, use_sample_data=parsed.sample)
+    if result.missing_assets:
+        logger.warning("Pipeline used sample data due to missing assets:")
+        for message in result.missing_assets:
+            logger.warning("  %s", message)
+    logger.info("Dataset exported to %s", result.output_path)
+
+
 def main(args: list[str] | None = None) -> None:
     parser = build_parser()
     parsed = parser.parse_args(args=args)
 
-    if parsed.command == "catalog":
-        catalog = DataCatalog()
-        catalog.log_summary()
-        print(json.dumps(catalog.summary(), indent=2))
-    elif parsed.command == "build-data":
-        result = build_analysis_dataset(output_path=parsed.output, use_sample_data=parsed.sample)
-        if result.missing_assets:
-            logger.warning("Pipeline used sample data due to missing assets:")
-            for message in result.missing_assets:
-                logger.warning("  %s", message)
-        logger.info("Dataset exported to %s", result.output_path)
-    else:
+    handler = getattr(parsed, "func", None)
+    if handler is None:
         parser.print_help()
+        return
+    handler(parsed)
 
 
 if __name__ == "__main__":  # pragma: no cover
@@ -43,7 +43,13 @@ class ProjectPaths:
         )
 
     def ensure(self) -> None:
-        """Create directories if they do not exist."""
+        """Create directories if they do not exist.
+
+        Instances are frozen, so once a set of paths has been ensured later
+        calls return without touching the filesystem.
+        """
+        if self in _ENSURED:
+            return
         for path in (
             self.data_raw,
             self.data_interim,
@@ -51,7 +57,13 @@ class ProjectPaths:
             self.reports,
             self.web_assets,
         ):
-            path.mkdir(parents=True, exist_ok=True)
+            if not path.is_dir():
+                path.mkdir(parents=True, exist_ok=True)
+        _ENSURED.add(self)
+
+
+# ProjectPaths instances whose directories have already been created
+_ENSURED: set[ProjectPaths] = set()
 
 
 paths = ProjectPaths.from_env()
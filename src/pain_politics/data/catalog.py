@@ -7,11 +7,13 @@ programmatically and which require manual intervention.
 
 from __future__ import annotations
 
+import os
 from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
-from typing import Iterable, List, Mapping, Optional
+from typing import Iterable, List, Mapping, Optional, Set, Tuple
 
-from ..config import paths
+from ..config import ProjectPaths, paths
 from ..utils import get_logger
 
 
@@ -26,10 +28,125 @@ class DataAsset:
     path: Path
     acquisition: str  # "automated" | "manual" | "api"
     notes: Optional[str] = None
+    parquet_twin: bool = False  # prep scripts also write a .parquet copy
+
+    @property
+    def candidates(self) -> Tuple[Path, ...]:
+        """Return the paths that satisfy this asset, preferred first."""
+        if self.parquet_twin:
+            return (self.path.with_suffix(".parquet"), self.path)
+        return (self.path,)
+
+    @property
+    def resolved_path(self) -> Path:
+        """Return the first existing candidate, or the canonical path."""
+        return next((p for p in self.candidates if p.exists()), self.path)
 
     @property
     def exists(self) -> bool:
-        return self.path.exists()
+        return any(p.exists() for p in self.candidates)
+
+
+@lru_cache(maxsize=4)
+def _default_assets(project_paths: ProjectPaths) -> Tuple[DataAsset, ...]:
+    """Build the baseline assets once per ``ProjectPaths`` instance."""
+    return (
+        DataAsset(
+            name="county_boundaries",
+            path=project_paths.data_raw / "shapefiles" / "tl_2023_us_county.shp",
+            acquisition="automated",
+            notes="Downloaded from Census TIGER/Line (2023 vintage).",
+        ),
+        DataAsset(
+            name="election_returns_2016",
+            path=project_paths.data_raw / "elections" / "county_presidential_2016.csv",
+            acquisition="manual",
+            notes="MIT Election Lab county returns.",
+            parquet_twin=True,
+        ),
+        DataAsset(
+            name="election_returns_2020",
+            path=project_paths.data_raw / "elections" / "county_presidential_2020.csv",
+            acquisition="manual",
+            notes="MIT Election Lab county returns.",
+            parquet_twin=True,
+        ),
+        DataAsset(
+            name="cdc_wonder_overdose_2013_2016",
+            path=project_paths.data_raw / "cdc_wonder" / "overdose_2013_2016.txt",
+            acquisition="manual",
+            notes="Export from CDC WONDER; tab-delimited.",
+            parquet_twin=True,
+        ),
+        DataAsset(
+            name="cdc_wonder_overdose_2017_2020",
+            path=project_paths.data_raw / "cdc_wonder" / "overdose_2017_2020.txt",
+            acquisition="manual",
+            notes="Export from CDC WONDER; tab-delimited.",
+            parquet_twin=True,
+        ),
+        DataAsset(
+            name="cdc_places",
+            path=project_paths.data_raw / "cdc_places" / "places_county_2023.csv",
+            acquisition="automated",
+            notes="CDC PLACES county estimates (2023 release).",
+        ),
+        DataAsset(
+            name="usda_rucc",
+            path=project_paths.data_raw / "usda" / "rucc_2023.xlsx",
+            acquisition="automated",
+            notes="USDA Rural-Urban Continuum Codes.",
+        ),
+        DataAsset(
+            name="acs_variables",
+            path=project_paths.data_raw / "census" / "acs_variables.json",
+            acquisition="api",
+            notes="Variable manifest for ACS API pulls.",
+        ),
+        DataAsset(
+            name="county_health_rankings_2024",
+            path=project_paths.data_raw / "analytic_data2024.csv",
+            acquisition="manual",
+            notes="County Health Rankings 2024 analytic data CSV.",
+        ),
+        DataAsset(
+            name="county_health_rankings_2016",
+            path=project_paths.data_raw / "analytic_data2016.csv",
+            acquisition="manual",
+            notes="County Health Rankings 2016 analytic data CSV.",
+        ),
+    )
+
+
+def _existing_paths(candidates: Iterable[Path]) -> Set[Path]:
+    """Return the candidates that exist, with one ``os.scandir`` per directory."""
+    by_parent = {}
+    for candidate in candidates:
+        by_parent.setdefault(candidate.parent, []).append(candidate)
+
+    existing: Set[Path] = set()
+    for parent, children in by_parent.items():
+        try:
+            with os.scandir(parent) as entries:
+                names = {entry.name for entry in entries}
+        except (FileNotFoundError, NotADirectoryError):
+            continue
+        existing.update(child for child in children if child.name in names)
+    return existing
+
+
+def asset_status(assets: Iterable[DataAsset]) -> List[Tuple[DataAsset, Optional[Path]]]:
+    """Pair each asset with its first existing candidate (or ``None``).
+
+    Existence is checked by listing each parent directory once rather than
+    calling ``Path.exists`` per candidate.
+    """
+    assets = list(assets)
+    present = _existing_paths(c for asset in assets for c in asset.candidates)
+    return [
+        (asset, next((c for c in asset.candidates if c in present), None))
+        for asset in assets
+    ]
 
 
 class DataCatalog:
@@ -45,81 +162,23 @@ class DataCatalog:
         return len(self._assets)
 
     @staticmethod
-    def default_assets() -> Iterable[DataAsset]:
+    def default_assets() -> Tuple[DataAsset, ...]:
         """Return the baseline list of required raw data assets."""
-        return [
-            DataAsset(
-                name="county_boundaries",
-                path=paths.data_raw / "shapefiles" / "tl_2023_us_county.shp",
-                acquisition="automated",
-                notes="Downloaded from Census TIGER/Line (2023 vintage).",
-            ),
-            DataAsset(
-                name="election_returns_2016",
-                path=paths.data_raw / "elections" / "county_presidential_2016.csv",
-                acquisition="manual",
-                notes="MIT Election Lab county returns.",
-            ),
-            DataAsset(
-                name="election_returns_2020",
-                path=paths.data_raw / "elections" / "county_presidential_2020.csv",
-                acquisition="manual",
-                notes="MIT Election Lab county returns.",
-            ),
-            DataAsset(
-                name="cdc_wonder_overdose_2013_2016",
-                path=paths.data_raw / "cdc_wonder" / "overdose_2013_2016.txt",
-                acquisition="manual",
-                notes="Export from CDC WONDER; tab-delimited.",
-            ),
-            DataAsset(
-                name="cdc_wonder_overdose_2017_2020",
-                path=paths.data_raw / "cdc_wonder" / "overdose_2017_2020.txt",
-                acquisition="manual",
-                notes="Export from CDC WONDER; tab-delimited.",
-            ),
-            DataAsset(
-                name="cdc_places",
-                path=paths.data_raw / "cdc_places" / "places_county_2023.csv",
-                acquisition="automated",
-                notes="CDC PLACES county estimates (2023 release).",
-            ),
-            DataAsset(
-                name="usda_rucc",
-                path=paths.data_raw / "usda" / "rucc_2023.xlsx",
-                acquisition="automated",
-                notes="USDA Rural-Urban Continuum Codes.",
-            ),
-            DataAsset(
-                name="acs_variables",
-                path=paths.data_raw / "census" / "acs_variables.json",
-                acquisition="api",
-                notes="Variable manifest for ACS API pulls.",
-            ),
-            DataAsset(
-                name="county_health_rankings_2024",
-                path=paths.data_raw / "analytic_data2024.csv",
-                acquisition="manual",
-                notes="County Health Rankings 2024 analytic data CSV.",
-            ),
-            DataAsset(
-                name="county_health_rankings_2016",
-                path=paths.data_raw / "analytic_data2016.csv",
-                acquisition="manual",
-                notes="County Health Rankings 2016 analytic data CSV.",
-            ),
-        ]
+        return _default_assets(paths)
+
+    def _with_status(self) -> List[Tuple[DataAsset, Optional[Path]]]:
+        return asset_status(self._assets)
 
     def summary(self) -> List[Mapping[str, str]]:
         """Return status summary for each asset."""
         summary: List[Mapping[str, str]] = []
-        for asset in self._assets:
+        for asset, found in self._with_status():
             summary.append(
                 {
                     "name": asset.name,
-                    "path": str(asset.path),
+                    "path": str(found or asset.path),
                     "acquisition": asset.acquisition,
-                    "exists": "yes" if asset.exists else "no",
+                    "exists": "yes" if found else "no",
                     "notes": asset.notes or "",
                 }
             )
@@ -127,7 +186,7 @@ class DataCatalog:
 
     def missing(self) -> List[DataAsset]:
         """Return list of assets whose files are absent."""
-        return [asset for asset in self._assets if not asset.exists]
+        return [asset for asset, found in self._with_status() if found is None]
 
     def ensure_directories(self) -> None:
         """Create parent directories for all assets."""
@@ -137,12 +196,12 @@ class DataCatalog:
     def log_summary(self) -> None:
         """Emit a human-readable status table to the logger."""
         logger.info("Data catalog status:")
-        for asset in self._assets:
-            status = "✅" if asset.exists else "⚠️ "
+        for asset, found in self._with_status():
+            status = "✅" if found else "⚠️ "
             logger.info(
                 "%s %-32s | %s | %s",
                 status,
                 asset.name,
                 asset.acquisition.ljust(9),
-                asset.path,
+                found or asset.path,
             )
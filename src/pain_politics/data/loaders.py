@@ -2,30 +2,210 @@
 
 from __future__ import annotations
 
+import csv
+import functools
+import hashlib
+import importlib.util
+from collections import OrderedDict
 from pathlib import Path
-from typing import Dict, Iterable, Optional
+from typing import Any, Callable, Dict, Iterable, Optional, TypeVar
 
 import geopandas as gpd
+import numpy as np
 import pandas as pd
 import re
 
+try:  # pragma: no cover - optional dependency
+    import pyarrow as pa
+    import pyarrow.csv as pacsv
+except ImportError:  # pragma: no cover - fallback to the pandas parser
+    pa = None
+    pacsv = None
+
 from ..config import paths
 from ..utils import get_logger
+from ..utils.pandas_options import enable_copy_on_write
 
+# Memoized loaders hand out shallow copies, which are only isolated under CoW
+enable_copy_on_write()
 
 logger = get_logger(__name__)
 
+# Rust-backed xlsx reader; pandas falls back to openpyxl when this is None
+_EXCEL_ENGINE = "calamine" if importlib.util.find_spec("python_calamine") else None
+
+# Any run of punctuation, whitespace or underscores collapses to one "_" in headers
+_NON_ALNUM_RUN = re.compile(r"[^0-9a-zA-Z]+")
+
+
+_Frame = TypeVar("_Frame", bound=pd.DataFrame)
+
+# Distinct argument combinations remembered per loader
+_LOADER_CACHE_SIZE = 4
+
+
+def _freeze(value: Any) -> Any:
+    """Turn loader arguments into a hashable cache key (dicts and lists included)."""
+    if isinstance(value, dict):
+        return tuple(sorted((key, _freeze(item)) for key, item in value.items()))
+    if isinstance(value, (list, tuple, set, frozenset)):
+        items = (_freeze(item) for item in value)
+        return tuple(sorted(items)) if isinstance(value, (set, frozenset)) else tuple(items)
+    return value
+
+
+def _memoize_loader(func: Callable[..., _Frame]) -> Callable[..., _Frame]:
+    """
+    Memoize a loader on its arguments and the active project ``paths``.
+
+    Hits return a shallow copy, which Copy-on-Write keeps independent of the
+    cached frame. Call ``<loader>.cache_clear()`` after editing a raw file.
+    """
+    cache: "OrderedDict[tuple, _Frame]" = OrderedDict()
+
+    @functools.wraps(func)
+    def wrapper(*args: Any, **kwargs: Any) -> _Frame:
+        try:
+            key = (paths, _freeze(args), _freeze(kwargs))
+            hash(key)
+        except TypeError:
+            return func(*args, **kwargs)
+
+        if key in cache:
+            cache.move_to_end(key)
+        else:
+            cache[key] = func(*args, **kwargs)
+            if len(cache) > _LOADER_CACHE_SIZE:
+                cache.popitem(last=False)
+        return cache[key].copy(deep=False)
+
+    wrapper.cache_clear = cache.clear  # type: ignore[attr-defined]
+    return wrapper
+
+
+def _fresh_parquet_twin(path: Path) -> Optional[Path]:
+    """Return the ``.parquet`` twin of ``path`` if it exists and is at least as new."""
+    parquet_path = path.with_suffix(".parquet")
+    if parquet_path.exists() and (
+        not path.exists() or parquet_path.stat().st_mtime >= path.stat().st_mtime
+    ):
+        return parquet_path
+    return None
+
+
+def _read_tabular(path: Path, **csv_kwargs) -> pd.DataFrame:
+    """Read ``path``, preferring an up-to-date ``.parquet`` twin when present."""
+    parquet_path = _fresh_parquet_twin(path)
+    if parquet_path is not None:
+        return pd.read_parquet(parquet_path)
+    return pd.read_csv(path, **csv_kwargs)
+
+
+def _zfill(values: Iterable, width: int) -> np.ndarray:
+    """Zero-pad codes to ``width`` characters in one vectorized NumPy pass."""
+    return np.char.zfill(np.asarray(values, dtype=str), width)
+
+
+def _read_csv_as_text(path: Path, columns: Optional[Iterable[str]] = None) -> pd.DataFrame:
+    """
+    Read ``path`` with every column as text, like ``dtype=str, keep_default_na=False``.
+
+    Uses PyArrow's multi-threaded CSV reader when available; ``columns`` limits
+    the read to the named columns that exist in the file.
+    """
+    wanted = None if columns is None else set(columns)
+    if pacsv is None:
+        usecols = None if wanted is None else (lambda col: col in wanted)
+        return pd.read_csv(path, dtype=str, keep_default_na=False, usecols=usecols)
+
+    with open(path, newline="", encoding="utf-8-sig") as handle:
+        header = next(csv.reader(handle), [])
+    if wanted is not None:
+        header = [col for col in header if col in wanted]
+    table = pacsv.read_csv(
+        path,
+        read_options=pacsv.ReadOptions(block_size=8 << 20),
+        # Quoted cells may contain line breaks, as pandas allows
+        parse_options=pacsv.ParseOptions(newlines_in_values=True),
+        convert_options=pacsv.ConvertOptions(
+            column_types={col: pa.string() for col in header},
+            include_columns=header if wanted is not None else None,
+        ),
+    )
+    return table.to_pandas()
+
+
+def _read_cached(path: Path, parser_fn: Callable[[Path], pd.DataFrame]) -> pd.DataFrame:
+    """
+    Return ``parser_fn(path)``, memoized as Parquet under ``data/interim/cache``.
+
+    The cache file is keyed on a hash of the resolved source path plus its size
+    and modification time, so same-named files in different directories never
+    share an entry and an edited source is parsed again. A cache that cannot be
+    written (e.g. no Parquet engine installed) is logged and skipped.
+    """
+    source = path.resolve()
+    stat = source.stat()
+    source_key = hashlib.sha1(str(source).encode("utf-8")).hexdigest()[:12]
+    version_key = hashlib.sha1(f"{stat.st_size}:{stat.st_mtime_ns}".encode("ascii")).hexdigest()[:12]
+    cache_prefix = f"{path.stem}.{parser_fn.__name__.strip('_')}.{source_key}"
+    cache_path = paths.data_interim / "cache" / f"{cache_prefix}-{version_key}.parquet"
+    if cache_path.exists():
+        return pd.read_parquet(cache_path)
+
+    df = parser_fn(path)
+    tmp_path = cache_path.with_suffix(".parquet.part")
+    try:
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        df.to_parquet(tmp_path, engine="pyarrow", compression="zstd", index=False)
+        tmp_path.replace(cache_path)
+        # Drop entries left behind by earlier versions of the same source
+        for stale in cache_path.parent.glob(f"{cache_prefix}-*.parquet"):
+            if stale != cache_path:
+                stale.unlink(missing_ok=True)
+    except (ImportError, OSError, ValueError, NotImplementedError) as exc:
+        logger.debug("Could not cache %s to %s: %s", path, cache_path, exc)
+        tmp_path.unlink(missing_ok=True)
+    return df
+
+
+@_memoize_loader
+def load_county_boundaries(
+    shapefile: Optional[Path] = None,
+    columns: Optional[Iterable[str]] = None,
+    exclude_states: Optional[Iterable[str]] = None,
+) -> gpd.GeoDataFrame:
+    """
+    Load county boundaries, defaulting to the TIGER shapefile.
 
-def load_county_boundaries(shapefile: Optional[Path] = None) -> gpd.GeoDataFrame:
-    """Load county boundaries, defaulting to the TIGER shapefile."""
+    ``columns`` limits the attribute fields that are decoded (``GEOID`` is always
+    read). ``exclude_states`` drops counties by ``STATEFP`` inside the reader, so
+    their geometries are never decoded. An up-to-date GeoParquet twin next to the
+    shapefile is preferred.
+    """
     file_path = shapefile or (paths.data_raw / "shapefiles" / "tl_2023_us_county.shp")
-    gdf = gpd.read_file(file_path)
+    fields = None if columns is None else list(dict.fromkeys(["GEOID", *columns]))
+    excluded = sorted(set(exclude_states or ()))
+    parquet_path = _fresh_parquet_twin(file_path)
+    if parquet_path is not None:
+        gdf = gpd.read_parquet(
+            parquet_path,
+            columns=None if fields is None else [*fields, "geometry"],
+            filters=[("STATEFP", "not in", excluded)] if excluded else None,
+        )
+    else:
+        where = None
+        if excluded:
+            codes = ", ".join(f"'{code}'" for code in excluded)
+            where = f"STATEFP NOT IN ({codes})"
+        gdf = gpd.read_file(file_path, engine="pyogrio", columns=fields, where=where)
     # Rename columns to uppercase, but preserve geometry
     gdf = gdf.rename(columns={col: col.upper() for col in gdf.columns if col != 'geometry'})
     gdf["fips"] = gdf["GEOID"]
     return gdf
 
 
+@_memoize_loader
 def load_election_returns(
     year: int,
     file_path: Optional[Path] = None,
@@ -34,7 +214,7 @@ def load_election_returns(
     """Load county-level presidential returns for the specified year."""
     candidates = tuple(candidates or ("TRUMP", "CLINTON" if year == 2016 else "BIDEN"))
     path = file_path or (paths.data_raw / "elections" / f"county_presidential_{year}.csv")
-    df = pd.read_csv(path, dtype=str, keep_default_na=False)
+    df = _read_tabular(path, dtype=str, keep_default_na=False)
     df.columns = df.columns.str.lower()
 
     # Ensure the necessary columns are present
@@ -53,27 +233,30 @@ def load_election_returns(
 
     # Build FIPS code
     if "state_fips" in df.columns:
-        df["fips"] = (
-            df["state_fips"].astype(str).str.zfill(2) + df["county_fips"].astype(str).str.zfill(3)
-        )
+        df["fips"] = np.char.add(_zfill(df["state_fips"], 2), _zfill(df["county_fips"], 3))
     else:
-        # county_fips already contains the full FIPS code
-        df["fips"] = df["county_fips"].astype(str).str.replace(".0", "", regex=False).str.zfill(5)
+        # county_fips already contains the full FIPS code, sometimes float-formatted
+        # ("1001.0"); non-numeric codes are padded as text as before
+        codes = pd.to_numeric(df["county_fips"], errors="coerce")
+        numeric = codes.notna().to_numpy()
+        df["fips"] = np.where(
+            numeric,
+            np.char.mod("%05d", codes.to_numpy(dtype=np.float64, na_value=0).astype(np.int64)),
+            _zfill(df["county_fips"].astype(str), 5),
+        )
 
     # Convert vote columns to numeric
     df["candidatevotes"] = pd.to_numeric(df["candidatevotes"], errors="coerce").fillna(0)
     df["totalvotes"] = pd.to_numeric(df["totalvotes"], errors="coerce").fillna(0)
 
-    trump = (
-        df[df["candidate"].str.contains("TRUMP", case=False, na=False)]
-        .groupby("fips")["candidatevotes"]
-        .sum()
-    )
-    opponent = (
-        df[df["candidate"].str.contains(candidates[1], case=False, na=False)]
-        .groupby("fips")["candidatevotes"]
-        .sum()
-    )
+    # Match names once per distinct candidate rather than once per row
+    codes, names = pd.factorize(df["candidate"].fillna(""))
+    names = pd.Index(names).str.upper()
+    is_trump = np.asarray(names.str.contains("TRUMP", regex=False))[codes]
+    is_opponent = np.asarray(names.str.contains(candidates[1].upper(), regex=False))[codes]
+
+    trump = df[is_trump].groupby("fips")["candidatevotes"].sum()
+    opponent = df[is_opponent].groupby("fips")["candidatevotes"].sum()
 
     totals = df.groupby("fips")["totalvotes"].sum()
     two_party_total = trump.add(opponent, fill_value=0)
@@ -99,15 +282,16 @@ def load_election_returns(
     return result.reset_index(drop=True)
 
 
+@_memoize_loader
 def load_cdc_wonder(file_path: Optional[Path], metric_name: str) -> pd.DataFrame:
     """Load and tidy CDC WONDER mortality exports."""
     path = file_path or (paths.data_raw / "cdc_wonder" / f"{metric_name}.txt")
-    df = pd.read_csv(path, sep="\t")
+    df = _read_tabular(path, sep="\t")
 
     if "County Code" not in df.columns:
         raise ValueError(f"CDC WONDER file {path} missing 'County Code'")
 
-    df["fips"] = df["County Code"].astype(str).str.zfill(5)
+    df["fips"] = _zfill(df["County Code"].astype(str), 5)
     numeric_cols = ["Deaths", "Population", "Age Adjusted Rate"]
     for col in numeric_cols:
         df[col] = pd.to_numeric(df[col], errors="coerce")
@@ -133,15 +317,23 @@ def load_cdc_wonder(file_path: Optional[Path], metric_name: str) -> pd.DataFrame
     return collapsed
 
 
+@_memoize_loader
 def load_cdc_places(file_path: Optional[Path] = None) -> pd.DataFrame:
     """Load the CDC PLACES county-level CSV and pivot indicators to wide format."""
     path = file_path or (paths.data_raw / "cdc_places" / "places_county_2023.csv")
-    df = pd.read_csv(path, dtype=str, keep_default_na=False)
+    return _read_cached(path, _parse_cdc_places)
+
+
+_PLACES_COLUMNS = ("DataValueTypeID", "LocationID", "MeasureId", "Data_Value")
+
+
+def _parse_cdc_places(path: Path) -> pd.DataFrame:
+    """Parse the raw PLACES CSV into one row per county with numeric indicators."""
+    df = _read_csv_as_text(path, columns=_PLACES_COLUMNS)
 
-    if {"DataValueTypeID", "LocationID", "MeasureId", "Data_Value"}.difference(df.columns):
+    if set(_PLACES_COLUMNS).difference(df.columns):
         raise ValueError("CDC PLACES file missing required columns")
 
-    county_df = df[df["DataValueTypeID"] == "AgeAdjPrv"].copy()
     indicators = {
         "ARTHRITIS": "arthritis_pct",
         "PHLTH": "freq_phys_distress_pct",
@@ -151,36 +343,54 @@ def load_cdc_places(file_path: Optional[Path] = None) -> pd.DataFrame:
         "DIABETES": "diabetes_pct",
     }
 
+    # Filter on both keys before reshaping so only the wanted cells are moved
+    is_age_adjusted = df["DataValueTypeID"].to_numpy() == "AgeAdjPrv"
+    mask = is_age_adjusted & df["MeasureId"].isin(indicators).to_numpy()
+    county_df = df.loc[mask, ["LocationID", "MeasureId"]]
+    county_df["Data_Value"] = pd.to_numeric(df.loc[mask, "Data_Value"], errors="coerce")
+
     pivot = (
-        county_df[county_df["MeasureId"].isin(indicators)]
-        .pivot(index="LocationID", columns="MeasureId", values="Data_Value")
+        county_df.set_index(["LocationID", "MeasureId"])["Data_Value"]
+        .astype(np.float64)
+        .unstack()
         .rename(columns=indicators)
     )
-    pivot.index.name = "fips"
-    pivot.index = pivot.index.astype(str).str.zfill(5)
-    
-    # Convert percentage columns to numeric
-    for col in pivot.columns:
-        pivot[col] = pd.to_numeric(pivot[col], errors="coerce")
-    
+    pivot.index = pd.Index(_zfill(pivot.index.astype(str), 5), name="fips")
     return pivot.reset_index()
 
 
+RUCC_CATEGORIES = ("Metro", "Micropolitan", "Rural")
+_RUCC_BINS = np.array([0, 3, 6, 9])
+
+
+def categorize_rucc(codes: Iterable) -> pd.Categorical:
+    """
+    Group RUCC codes into Metro (1-3), Micropolitan (4-6) and Rural (7-9).
+
+    Equivalent to ``pd.cut(codes, bins=[0, 3, 6, 9], labels=RUCC_CATEGORIES)``:
+    values outside (0, 9] and missing codes map to NaN.
+    """
+    bins = np.digitize(np.asarray(codes, dtype=np.float64), _RUCC_BINS, right=True) - 1
+    bins[(bins < 0) | (bins >= len(RUCC_CATEGORIES))] = -1
+    return pd.Categorical.from_codes(bins, categories=RUCC_CATEGORIES, ordered=True)
+
+
+@_memoize_loader
 def load_rucc(file_path: Optional[Path] = None) -> pd.DataFrame:
     """Load USDA Rural-Urban Continuum Codes."""
     path = file_path or (paths.data_raw / "usda" / "rucc_2023.xlsx")
-    df = pd.read_excel(path)
+    return _read_cached(path, _parse_rucc)
+
+
+def _parse_rucc(path: Path) -> pd.DataFrame:
+    """Parse the RUCC workbook, using the calamine reader when it is installed."""
+    df = pd.read_excel(path, engine=_EXCEL_ENGINE)
     if {"FIPS", "RUCC_2023"}.difference(df.columns):
         raise ValueError("RUCC file missing required columns")
 
-    df["fips"] = df["FIPS"].astype(str).str.zfill(5)
-    df["rural"] = (df["RUCC_2023"] >= 4).astype(int)
-    df["rucc_category"] = pd.cut(
-        df["RUCC_2023"],
-        bins=[0, 3, 6, 9],
-        labels=["Metro", "Micropolitan", "Rural"],
-        right=True,
-    )
+    df["fips"] = _zfill(df["FIPS"].astype(str), 5)
+    df["rural"] = (df["RUCC_2023"].to_numpy() >= 4).astype(np.int8)
+    df["rucc_category"] = categorize_rucc(df["RUCC_2023"])
 
     return df[["fips", "RUCC_2023", "rural", "rucc_category"]].rename(
         columns={"RUCC_2023": "rucc"}
@@ -189,11 +399,7 @@ def load_rucc(file_path: Optional[Path] = None) -> pd.DataFrame:
 
 def _snake_case(name: str) -> str:
     """Normalize messy headers (spaces, punctuation) into snake_case."""
-    name = name.strip()
-    name = re.sub(r"[()/%-]", " ", name)
-    name = re.sub(r"[^0-9a-zA-Z]+", "_", name)
-    name = re.sub(r"_+", "_", name)
-    return name.strip("_").lower()
+    return _NON_ALNUM_RUN.sub("_", name).strip("_").lower()
 
 
 def _deduplicate_columns(columns: Iterable[str]) -> list[str]:
@@ -210,6 +416,48 @@ def _deduplicate_columns(columns: Iterable[str]) -> list[str]:
     return result
 
 
+def _parse_chr_frame(path: Path) -> pd.DataFrame:
+    """Read a CHR analytic CSV with snake_case headers and county-level FIPS rows only."""
+    df = _read_csv_as_text(path)
+
+    normalized_cols = [_snake_case(col) for col in df.columns]
+    normalized_cols = _deduplicate_columns(normalized_cols)
+    df.columns = normalized_cols
+
+    rename_base = {
+        "state_fips_code": "state_fips",
+        "county_fips_code": "county_fips",
+        "5_digit_fips_code": "fips",
+        "state_abbreviation": "state_abbr",
+        "name": "county_name_chr",
+        "release_year": "chr_release_year",
+        "county_clustered_yes_1_no_0": "chr_county_clustered",
+        "county_ranked_yes_1_no_0": "chr_county_ranked",
+    }
+    df = df.rename(columns=rename_base)
+
+    if "fips" not in df.columns:
+        raise ValueError("CHR dataset is missing a FIPS column after normalization.")
+
+    df["fips"] = df["fips"].astype(str).str.strip()
+    header_mask = df["fips"].str.lower() == "fipscode"
+    if header_mask.any():
+        df = df[~header_mask]
+
+    df["fips"] = _zfill(df["fips"], 5)
+    df = df[df["fips"] != "00000"]
+    df = df[df["fips"].str[-3:] != "000"]
+    if "state_fips" in df.columns:
+        df["state_fips"] = _zfill(df["state_fips"].astype(str), 2)
+    if "county_fips" in df.columns:
+        df["county_fips"] = _zfill(df["county_fips"].astype(str), 3)
+    return df
+
+
+_CHR_FLAG_COLUMNS = frozenset({"chr_county_clustered", "chr_county_ranked"})
+
+
+@_memoize_loader
 def load_county_health_rankings(
     release_year: int,
     file_path: Optional[Path] = None,
@@ -241,39 +489,7 @@ def load_county_health_rankings(
     if not path.exists():
         raise FileNotFoundError(f"County Health Rankings file not found at {path}")
 
-    df = pd.read_csv(path, dtype=str, keep_default_na=False)
-
-    normalized_cols = [_snake_case(col) for col in df.columns]
-    normalized_cols = _deduplicate_columns(normalized_cols)
-    df.columns = normalized_cols
-
-    rename_base = {
-        "state_fips_code": "state_fips",
-        "county_fips_code": "county_fips",
-        "5_digit_fips_code": "fips",
-        "state_abbreviation": "state_abbr",
-        "name": "county_name_chr",
-        "release_year": "chr_release_year",
-        "county_clustered_yes_1_no_0": "chr_county_clustered",
-        "county_ranked_yes_1_no_0": "chr_county_ranked",
-    }
-    df = df.rename(columns=rename_base)
-
-    if "fips" not in df.columns:
-        raise ValueError("CHR dataset is missing a FIPS column after normalization.")
-
-    df["fips"] = df["fips"].astype(str).str.strip()
-    header_mask = df["fips"].str.lower() == "fipscode"
-    if header_mask.any():
-        df = df[~header_mask]
-
-    df["fips"] = df["fips"].str.zfill(5)
-    df = df[df["fips"] != "00000"]
-    df = df[df["fips"].str[-3:] != "000"]
-    if "state_fips" in df.columns:
-        df["state_fips"] = df["state_fips"].astype(str).str.zfill(2)
-    if "county_fips" in df.columns:
-        df["county_fips"] = df["county_fips"].astype(str).str.zfill(3)
+    df = _read_cached(path, _parse_chr_frame)
 
     metrics_map = select_metrics or {
         "frequent_physical_distress_raw_value": "chr_freq_phys_distress_pct",
@@ -313,8 +529,14 @@ def load_county_health_rankings(
 
     df = df[keep_cols].rename(columns=available_metrics)
 
+    # Coerce the whole metric block in one to_numeric call instead of per column
     numeric_cols = [col for col in df.columns if col not in {"fips"}]
-    df[numeric_cols] = df[numeric_cols].apply(pd.to_numeric, errors="coerce")
+    block = df[numeric_cols].to_numpy(dtype=object)
+    coerced = pd.to_numeric(block.ravel(), errors="coerce").astype(np.float64)
+    df[numeric_cols] = coerced.reshape(block.shape)
+    # The yes/no flags stay integers; blanks in them become <NA>
+    for flag in _CHR_FLAG_COLUMNS.intersection(df.columns):
+        df[flag] = df[flag].astype("Int64")
 
     df["chr_release_year"] = df["chr_release_year"].fillna(release_year).astype(int)
 
@@ -4,13 +4,13 @@ from __future__ import annotations
 
 from typing import Iterable, List, Tuple
 
-from .catalog import DataAsset
+from .catalog import DataAsset, asset_status
 
 
 def validate_required_files(assets: Iterable[DataAsset]) -> Tuple[bool, List[str]]:
     """Return (is_valid, missing_messages) for the provided assets."""
 
-    missing = [asset for asset in assets if not asset.exists]
+    missing = [asset for asset, found in asset_status(assets) if found is None]
     if not missing:
         return True, []
 
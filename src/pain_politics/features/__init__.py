@@ -1,6 +1,11 @@
 """Feature engineering helpers."""
 
 from .pain_metrics import compute_distress_metrics
-from .spatial import add_spatial_lag, build_spatial_weights
+from .spatial import add_spatial_lag, add_spatial_lags, build_spatial_weights
 
-__all__ = ["compute_distress_metrics", "build_spatial_weights", "add_spatial_lag"]
+__all__ = [
+    "compute_distress_metrics",
+    "build_spatial_weights",
+    "add_spatial_lag",
+    "add_spatial_lags",
+]
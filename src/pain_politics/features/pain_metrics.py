@@ -2,8 +2,13 @@
 
 from __future__ import annotations
 
+import numpy as np
 import pandas as pd
 
+from ..utils.pandas_options import enable_copy_on_write
+
+enable_copy_on_write()
+
 
 def compute_distress_metrics(df: pd.DataFrame) -> pd.DataFrame:
     """
@@ -15,7 +20,8 @@ def compute_distress_metrics(df: pd.DataFrame) -> pd.DataFrame:
         - freq_phys_distress_pct (optional)
     """
 
-    df = df.copy()
+    # Shallow copy: new columns never touch the caller's frame (Copy-on-Write)
+    df = df.copy(deep=False)
 
     if {"trump_share_2016", "trump_share_2020"}.issubset(df.columns):
         df["trump_shift_16_20"] = df["trump_share_2020"] - df["trump_share_2016"]
@@ -36,10 +42,16 @@ def zscore_pair(series_a: pd.Series, series_b: pd.Series) -> pd.Series:
     Return a composite z-score highlighting counties that score high on both inputs.
 
     The function standardizes each series and averages them, preserving NaNs.
+    Both inputs are expected to share an index (typically two columns of one frame).
     """
-    standardized = [
-        (series_a - series_a.mean()) / series_a.std(ddof=0),
-        (series_b - series_b.mean()) / series_b.std(ddof=0),
-    ]
-    return sum(standardized) / len(standardized)
-
+    values = np.vstack(
+        [
+            series_a.to_numpy(dtype=np.float64, na_value=np.nan),
+            series_b.to_numpy(dtype=np.float64, na_value=np.nan),
+        ]
+    )
+    with np.errstate(divide="ignore", invalid="ignore"):
+        standardized = (values - np.nanmean(values, axis=1, keepdims=True)) / np.nanstd(
+            values, axis=1, keepdims=True
+        )
+    return pd.Series(standardized.mean(axis=0), index=series_a.index)
@@ -2,11 +2,16 @@
 
 from __future__ import annotations
 
-from typing import Literal, Optional
+from typing import Literal, Optional, Sequence
 
 import geopandas as gpd
 import numpy as np
-from libpysal.weights import KNN, Queen, Rook, W
+import shapely
+from libpysal.weights import KNN, W
+
+from ..utils.pandas_options import enable_copy_on_write
+
+enable_copy_on_write()
 
 
 WeightType = Literal["queen", "rook", "knn"]
@@ -19,10 +24,8 @@ def build_spatial_weights(
     if not isinstance(gdf, gpd.GeoDataFrame):
         raise TypeError("Input must be a GeoDataFrame with geometry.")
 
-    if weight_type == "queen":
-        w = Queen.from_dataframe(gdf, use_index=True)
-    elif weight_type == "rook":
-        w = Rook.from_dataframe(gdf, use_index=True)
+    if weight_type in ("queen", "rook"):
+        w = _contiguity_weights(gdf, rook=weight_type == "rook")
     elif weight_type == "knn":
         w = KNN.from_dataframe(gdf, k=k_neighbors)
     else:
@@ -32,16 +35,57 @@ def build_spatial_weights(
     return w
 
 
+def _contiguity_weights(gdf: gpd.GeoDataFrame, rook: bool = False) -> W:
+    """
+    Build contiguity weights keyed by the frame index from one STRtree sweep.
+
+    Pairs come from a bulk ``touches`` query on the spatial index, so only
+    bounding-box neighbors are tested and polygons that overlap or contain
+    one another are not neighbors, as with libpysal's ``Queen``. Rook
+    additionally requires the shared boundary to be a line (DE-9IM
+    boundary/boundary dimension 1).
+    """
+    geoms = gdf.geometry.values
+    left, right = gdf.sindex.query(geoms, predicate="touches")
+    keep = left != right
+    left, right = left[keep], right[keep]
+    if rook and len(left):
+        shared_edge = shapely.relate_pattern(
+            np.asarray(geoms)[left], np.asarray(geoms)[right], "****1****"
+        )
+        left, right = left[shared_edge], right[shared_edge]
+
+    ids = gdf.index.tolist()
+    neighbors = {i: [] for i in ids}
+    for i, j in zip(left.tolist(), right.tolist()):
+        neighbors[ids[i]].append(ids[j])
+    return W(neighbors, silence_warnings=True)
+
+
 def add_spatial_lag(
     gdf: gpd.GeoDataFrame, column: str, w: Optional[W] = None, weight_type: WeightType = "queen"
 ) -> gpd.GeoDataFrame:
     """Append a spatial lag column for the specified feature."""
-    if column not in gdf.columns:
-        raise ValueError(f"Column '{column}' not found in GeoDataFrame.")
+    return add_spatial_lags(gdf, [column], w=w, weight_type=weight_type)
 
-    local_w = w or build_spatial_weights(gdf, weight_type=weight_type)
-    lag_values = local_w.sparse.dot(gdf[column].fillna(0).values)
-    gdf = gdf.copy()
-    gdf[f"{column}_lag"] = np.asarray(lag_values).flatten()
-    return gdf
 
+def add_spatial_lags(
+    gdf: gpd.GeoDataFrame,
+    columns: Sequence[str],
+    w: Optional[W] = None,
+    weight_type: WeightType = "queen",
+) -> gpd.GeoDataFrame:
+    """Append ``<column>_lag`` for each column using a single sparse matrix product."""
+    columns = list(columns)
+    missing = [column for column in columns if column not in gdf.columns]
+    if missing:
+        raise ValueError(f"Column '{missing[0]}' not found in GeoDataFrame.")
+
+    local_w = w if w is not None else build_spatial_weights(gdf, weight_type=weight_type)
+    # W.sparse is cached on the weights object, so repeated lags reuse one CSR matrix
+    values = gdf[columns].to_numpy(dtype=np.float64, na_value=0.0)
+    lags = local_w.sparse @ values
+    gdf = gdf.copy(deep=False)
+    for position, column in enumerate(columns):
+        gdf[f"{column}_lag"] = lags[:, position]
+    return gdf
@@ -2,13 +2,17 @@
 
 from __future__ import annotations
 
+import hashlib
+from collections import OrderedDict
 from dataclasses import dataclass
-from typing import Dict, List
+from typing import Dict, List, Tuple
 
 import geopandas as gpd
 import numpy as np
 import pandas as pd
+import shapely
 import statsmodels.api as sm
+from libpysal.weights import W, w_subset
 
 from ..features import build_spatial_weights
 from ..utils import get_logger
@@ -16,6 +20,10 @@ from ..utils import get_logger
 
 logger = get_logger(__name__)
 
+# Contiguity weights for whole frames, keyed by (weight_type, geometry digest)
+_WEIGHTS_CACHE: "OrderedDict[Tuple[str, bytes], W]" = OrderedDict()
+_WEIGHTS_CACHE_SIZE = 8
+
 
 @dataclass(frozen=True)
 class ModelSummary:
@@ -49,16 +57,20 @@ class SpatialRegressionSuite:
 
     def fit(self) -> Dict[str, ModelSummary]:
         """Run OLS and spatial models, storing results."""
-        df = self.gdf[self.predictors + [self.dependent]].copy()
+        df = self.gdf[self.predictors + [self.dependent]]
         if self.dropna:
             df = df.dropna()
 
         if df.empty:
             raise ValueError("No observations available after dropping missing values.")
 
-        X = sm.add_constant(df[self.predictors])
-        y = df[self.dependent]
-        ols_model = sm.OLS(y, X).fit()
+        # One Fortran-ordered design matrix: OLS uses it whole, spreg reuses the
+        # predictor columns (it adds its own constant) without another copy.
+        design = np.empty((len(df), len(self.predictors) + 1), dtype=np.float64, order="F")
+        design[:, 0] = 1.0
+        design[:, 1:] = df[self.predictors].to_numpy(dtype=np.float64)
+        y_values = df[self.dependent].to_numpy(dtype=np.float64)
+        ols_model = sm.OLS(y_values, design).fit()
         self.results["ols"] = ModelSummary(
             name="OLS",
             coefficients=_coef_table(ols_model.params, ols_model.bse),
@@ -74,11 +86,10 @@ class SpatialRegressionSuite:
             logger.warning("spreg not available; skipping spatial models.")
             return self.results
 
-        modeling_gdf = self.gdf.loc[df.index]
-        w = build_spatial_weights(modeling_gdf, weight_type=self.weight_type)
+        w = _modeling_weights(self.gdf, df.index, self.weight_type)
 
-        y_array = y.values.reshape(-1, 1)
-        X_array = df[self.predictors].values
+        y_array = y_values.reshape(-1, 1)
+        X_array = design[:, 1:]
 
         lag_model = ML_Lag(
             y_array,
@@ -129,22 +140,49 @@ class SpatialRegressionSuite:
 
         frames = []
         for name, summary in self.results.items():
-            df = summary.coefficients.copy()
-            df["model"] = name
-            frames.append(df)
+            frames.append(summary.coefficients.assign(model=name))
         return pd.concat(frames, ignore_index=True)
 
 
+def _modeling_weights(gdf: gpd.GeoDataFrame, index: pd.Index, weight_type: str) -> W:
+    """
+    Return row-standardized weights for the rows of ``gdf`` selected by ``index``.
+
+    Contiguity is a pairwise property, so queen/rook weights are built once per
+    distinct frame and subset to the modeling rows. KNN neighbors depend on which
+    rows are present and are always rebuilt.
+    """
+    if weight_type not in ("queen", "rook"):
+        return build_spatial_weights(gdf.loc[index], weight_type=weight_type)
+
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update(pd.util.hash_pandas_object(gdf.index, index=False).to_numpy().tobytes())
+    for wkb in shapely.to_wkb(gdf.geometry.values):
+        digest.update(wkb)
+    key = (weight_type, digest.digest())
+
+    full_w = _WEIGHTS_CACHE.get(key)
+    if full_w is None:
+        full_w = build_spatial_weights(gdf, weight_type=weight_type)
+        _WEIGHTS_CACHE[key] = full_w
+        if len(_WEIGHTS_CACHE) > _WEIGHTS_CACHE_SIZE:
+            _WEIGHTS_CACHE.popitem(last=False)
+    else:
+        _WEIGHTS_CACHE.move_to_end(key)
+
+    w = w_subset(full_w, index.tolist(), silence_warnings=True)
+    w.transform = "r"
+    return w
+
+
+_COEF_COLUMNS = ["coefficient", "std_error", "z_score"]
+
+
 def _coef_table(estimates: np.ndarray, std_errors: np.ndarray) -> pd.DataFrame:
     """Return tidy coefficient table with z statistics."""
-    estimates = np.asarray(estimates).reshape(-1)
-    std_errors = np.asarray(std_errors).reshape(-1)
-    z_scores = np.divide(estimates, std_errors, out=np.zeros_like(estimates), where=std_errors != 0)
-    return pd.DataFrame(
-        {
-            "coefficient": estimates,
-            "std_error": std_errors,
-            "z_score": z_scores,
-        }
-    )
-
+    block = np.zeros((np.size(estimates), len(_COEF_COLUMNS)), dtype=np.float64)
+    block[:, 0] = np.asarray(estimates, dtype=np.float64).reshape(-1)
+    block[:, 1] = np.asarray(std_errors, dtype=np.float64).reshape(-1)
+    np.divide(block[:, 0], block[:, 1], out=block[:, 2], where=block[:, 1] != 0)
+    # A single float64 block skips pandas' per-column dtype inference
+    return pd.DataFrame(block, columns=_COEF_COLUMNS)
@@ -4,9 +4,10 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 from pathlib import Path
-from typing import List, Optional
+from typing import Dict, List, Optional
 
 import geopandas as gpd
+import numpy as np
 import pandas as pd
 
 from ..config import ProjectPaths, paths
@@ -26,6 +27,12 @@ from .sample_data import build_sample_geo_frame
 
 logger = get_logger(__name__)
 
+# Alaska, Hawaii and the territories fall outside the contiguous-county analysis
+EXCLUDED_STATE_FIPS = ("02", "15", "60", "66", "69", "72", "78")
+
+# Precision of fractional (rate, share and percentage) values in the analysis GeoJSON
+GEOJSON_SIGNIFICANT_FIGURES = 7
+
 
 @dataclass
 class BuildResult:
@@ -78,8 +85,13 @@ def build_analysis_dataset(
 
     project_paths.ensure()
     target = output_path or (project_paths.data_processed / "counties_analysis.geojson")
-    gdf.to_file(target, driver="GeoJSON")
+    _geojson_export_frame(gdf).to_file(target, driver="GeoJSON")
     logger.info("Exported %s counties to %s", len(gdf), target)
+    try:
+        # Full-precision GeoParquet twin for Python consumers
+        gdf.to_parquet(target.with_suffix(".parquet"))
+    except ImportError as exc:  # pragma: no cover - pyarrow is a core dependency
+        logger.debug("Skipping GeoParquet export: %s", exc)
 
     return BuildResult(
         dataset=gdf,
@@ -89,10 +101,52 @@ def build_analysis_dataset(
     )
 
 
+def _round_significant(values: np.ndarray, figures: int) -> np.ndarray:
+    """
+    Round ``values`` to ``figures`` significant figures, like ``float(f"{v:.7g}")``.
+
+    Each element needs ``figures - 1 - floor(log10(|v|))`` decimals; elements
+    sharing a decimal count are rounded together with one ``np.round`` call.
+    Zeros, NaN and infinities pass through unchanged.
+    """
+    rounded = np.array(values, dtype=np.float64, copy=True)
+    mask = np.isfinite(rounded) & (rounded != 0)
+    subset = rounded[mask]
+    decimals = figures - 1 - np.floor(np.log10(np.abs(subset))).astype(np.int64)
+    for count in np.unique(decimals):
+        group = decimals == count
+        subset[group] = np.round(subset[group], count)
+    rounded[mask] = subset
+    return rounded
+
+
+def _geojson_export_frame(gdf: gpd.GeoDataFrame) -> gpd.GeoDataFrame:
+    """
+    Prepare numeric attributes for the GeoJSON export.
+
+    Float columns holding only whole numbers (population and vote counts) are
+    written as nullable integers so they stay exact. The remaining float
+    columns are rounded to ``GEOJSON_SIGNIFICANT_FIGURES``; GDAL writes a
+    rounded double in its shortest form (73.9 rather than 73.900002).
+    """
+    export = gdf.copy()
+    for column in export.select_dtypes("float").columns:
+        values = export[column].to_numpy(dtype=np.float64)
+        present = values[~np.isnan(values)]
+        if present.size == 0:
+            continue
+        if np.isfinite(present).all() and (present == np.round(present)).all():
+            export[column] = export[column].astype("Int64")
+        else:
+            export[column] = _round_significant(values, GEOJSON_SIGNIFICANT_FIGURES)
+    return export
+
+
 def _build_from_raw_assets(project_paths: ProjectPaths) -> gpd.GeoDataFrame:
     """Load, merge, and tidy the canonical raw datasets."""
-    counties = load_county_boundaries()
-    counties = counties[~counties["STATEFP"].isin(["02", "15", "60", "66", "69", "72", "78"])]
+    counties = load_county_boundaries(
+        columns=["STATEFP", "NAME"], exclude_states=EXCLUDED_STATE_FIPS
+    )
     counties = counties.rename(columns={"NAME": "county_name", "STATEFP": "state_fips"})
 
     election_2016 = load_election_returns(2016)
@@ -119,25 +173,49 @@ def _build_from_raw_assets(project_paths: ProjectPaths) -> gpd.GeoDataFrame:
     ).rename(
         columns={
             "chr_release_year": "chr_release_year_2016",
+            "chr_county_clustered": "chr_county_clustered_2016",
             "chr_county_ranked": "chr_county_ranked_2016",
         }
     )
 
-    dfs: List[pd.DataFrame] = [
-        election_2016,
-        election_2020,
-        overdose_1316,
-        overdose_1720,
-        places,
-        rucc,
-        chr_2024,
-        chr_2016,
-    ]
-
-    merged = counties[["fips", "county_name", "state_fips", "geometry"]].copy()
-
-    for df in dfs:
-        merged = merged.merge(df, on="fips", how="left")
+    sources: Dict[str, pd.DataFrame] = {
+        "election_2016": election_2016,
+        "election_2020": election_2020,
+        "overdose_2013_2016": overdose_1316,
+        "overdose_2017_2020": overdose_1720,
+        "cdc_places": places,
+        "rucc": rucc,
+        "chr_2024": chr_2024,
+        "chr_2016": chr_2016,
+    }
+
+    # Align every source on fips in one pass, then attach to the county shapes
+    indexed = []
+    column_owner: Dict[str, str] = {}
+    for name, df in sources.items():
+        frame = df.set_index("fips")
+        if not frame.index.is_unique:
+            duplicates = frame.index[frame.index.duplicated()].unique()
+            raise ValueError(
+                f"{name} has duplicate fips codes, cannot align sources: "
+                f"{', '.join(map(str, duplicates[:5]))}"
+            )
+        # concat keeps repeated labels silently, so shared columns are rejected here
+        for column in frame.columns:
+            if column in column_owner:
+                raise ValueError(
+                    f"{column_owner[column]} and {name} both provide column '{column}'; "
+                    "rename one before aligning sources"
+                )
+            column_owner[column] = name
+        indexed.append(frame)
+    attributes = pd.concat(indexed, axis=1)
+    merged = (
+        counties[["fips", "county_name", "state_fips", "geometry"]]
+        .set_index("fips")
+        .join(attributes, how="left")
+        .reset_index()
+    )
 
     merged["ba_plus_pct"] = merged.get("ba_plus_pct", pd.Series(dtype=float))
     merged["median_income"] = merged.get("median_income", pd.Series(dtype=float))
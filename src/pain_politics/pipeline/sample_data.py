@@ -2,13 +2,15 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass
-from typing import List
+from dataclasses import dataclass, fields
+from typing import Dict, Tuple
 
 import geopandas as gpd
 import numpy as np
 import pandas as pd
-from shapely.geometry import Polygon
+import shapely
+
+from ..data.loaders import categorize_rucc
 
 
 @dataclass(frozen=True)
@@ -26,97 +28,110 @@ class SampleCounty:
     rucc: int
 
 
+SAMPLE_COUNTIES: Tuple[SampleCounty, ...] = (
+    SampleCounty(
+        fips="01001",
+        county_name="Autauga",
+        state_fips="01",
+        trump_share_2016=73.9,
+        trump_share_2020=74.4,
+        od_1316_rate=16.5,
+        od_1720_rate=20.4,
+        freq_phys_distress_pct=13.2,
+        arthritis_pct=28.3,
+        rural=0,
+        rucc=2,
+    ),
+    SampleCounty(
+        fips="01003",
+        county_name="Baldwin",
+        state_fips="01",
+        trump_share_2016=78.8,
+        trump_share_2020=79.2,
+        od_1316_rate=19.1,
+        od_1720_rate=24.6,
+        freq_phys_distress_pct=12.1,
+        arthritis_pct=27.2,
+        rural=0,
+        rucc=3,
+    ),
+    SampleCounty(
+        fips="01005",
+        county_name="Barbour",
+        state_fips="01",
+        trump_share_2016=68.5,
+        trump_share_2020=70.1,
+        od_1316_rate=25.3,
+        od_1720_rate=32.8,
+        freq_phys_distress_pct=17.6,
+        arthritis_pct=31.2,
+        rural=1,
+        rucc=6,
+    ),
+    SampleCounty(
+        fips="01007",
+        county_name="Bibb",
+        state_fips="01",
+        trump_share_2016=76.5,
+        trump_share_2020=77.6,
+        od_1316_rate=14.7,
+        od_1720_rate=18.1,
+        freq_phys_distress_pct=15.2,
+        arthritis_pct=30.5,
+        rural=1,
+        rucc=7,
+    ),
+    SampleCounty(
+        fips="01009",
+        county_name="Blount",
+        state_fips="01",
+        trump_share_2016=84.9,
+        trump_share_2020=85.5,
+        od_1316_rate=21.4,
+        od_1720_rate=27.0,
+        freq_phys_distress_pct=14.6,
+        arthritis_pct=33.0,
+        rural=1,
+        rucc=6,
+    ),
+)
+
+
+def _columns(counties: Tuple[SampleCounty, ...]) -> Dict[str, np.ndarray]:
+    """Transpose sample records into one array per schema field."""
+    return {
+        field.name: np.array([getattr(county, field.name) for county in counties])
+        for field in fields(SampleCounty)
+    }
+
+
+def _covariates(count: int) -> Tuple[np.ndarray, np.ndarray]:
+    """Seeded education and income columns, fixed for the life of the process."""
+    rng = np.random.default_rng(seed=42)
+    ba_plus_pct = rng.normal(loc=20.0, scale=2.5, size=count).round(1)
+    median_income = rng.normal(loc=52000, scale=3500, size=count).round().astype(int)
+    return ba_plus_pct, median_income
+
+
+def _squares(count: int) -> np.ndarray:
+    """Unit squares spaced 1.5 degrees apart along latitude 32-33."""
+    x = np.arange(count)[:, None] * 1.5 + np.array([0.0, 1.0, 1.0, 0.0])
+    y = np.broadcast_to(np.array([32.0, 32.0, 33.0, 33.0]), x.shape)
+    return shapely.polygons(np.stack([x, y], axis=-1))
+
+
+# Arrays are built once at import; each call only wraps copies in a frame.
+_SAMPLE_COLUMNS = _columns(SAMPLE_COUNTIES)
+_BA_PLUS_PCT, _MEDIAN_INCOME = _covariates(len(SAMPLE_COUNTIES))
+_GEOMETRIES = _squares(len(SAMPLE_COUNTIES))
+
+
 def build_sample_geo_frame() -> gpd.GeoDataFrame:
     """Return a small synthetic dataset that mimics the real schema."""
-    counties: List[SampleCounty] = [
-        SampleCounty(
-            fips="01001",
-            county_name="Autauga",
-            state_fips="01",
-            trump_share_2016=73.9,
-            trump_share_2020=74.4,
-            od_1316_rate=16.5,
-            od_1720_rate=20.4,
-            freq_phys_distress_pct=13.2,
-            arthritis_pct=28.3,
-            rural=0,
-            rucc=2,
-        ),
-        SampleCounty(
-            fips="01003",
-            county_name="Baldwin",
-            state_fips="01",
-            trump_share_2016=78.8,
-            trump_share_2020=79.2,
-            od_1316_rate=19.1,
-            od_1720_rate=24.6,
-            freq_phys_distress_pct=12.1,
-            arthritis_pct=27.2,
-            rural=0,
-            rucc=3,
-        ),
-        SampleCounty(
-            fips="01005",
-            county_name="Barbour",
-            state_fips="01",
-            trump_share_2016=68.5,
-            trump_share_2020=70.1,
-            od_1316_rate=25.3,
-            od_1720_rate=32.8,
-            freq_phys_distress_pct=17.6,
-            arthritis_pct=31.2,
-            rural=1,
-            rucc=6,
-        ),
-        SampleCounty(
-            fips="01007",
-            county_name="Bibb",
-            state_fips="01",
-            trump_share_2016=76.5,
-            trump_share_2020=77.6,
-            od_1316_rate=14.7,
-            od_1720_rate=18.1,
-            freq_phys_distress_pct=15.2,
-            arthritis_pct=30.5,
-            rural=1,
-            rucc=7,
-        ),
-        SampleCounty(
-            fips="01009",
-            county_name="Blount",
-            state_fips="01",
-            trump_share_2016=84.9,
-            trump_share_2020=85.5,
-            od_1316_rate=21.4,
-            od_1720_rate=27.0,
-            freq_phys_distress_pct=14.6,
-            arthritis_pct=33.0,
-            rural=1,
-            rucc=6,
-        ),
-    ]
-
-    df = pd.DataFrame([c.__dict__ for c in counties])
-    df["rucc_category"] = pd.cut(
-        df["rucc"], bins=[0, 3, 6, 9], labels=["Metro", "Micropolitan", "Rural"]
-    )
+    df = pd.DataFrame({name: values.copy() for name, values in _SAMPLE_COLUMNS.items()})
+    df["rucc_category"] = categorize_rucc(df["rucc"])
+    df["ba_plus_pct"] = _BA_PLUS_PCT.copy()
+    df["median_income"] = _MEDIAN_INCOME.copy()
 
-    rng = np.random.default_rng(seed=42)
-    df["ba_plus_pct"] = rng.normal(loc=20.0, scale=2.5, size=len(df)).round(1)
-    df["median_income"] = rng.normal(loc=52000, scale=3500, size=len(df)).round().astype(int)
-
-    geometries = []
-    for idx, _ in enumerate(counties):
-        x_offset = idx * 1.5
-        polygon = Polygon(
-            [
-                (x_offset, 32.0),
-                (x_offset + 1, 32.0),
-                (x_offset + 1, 33.0),
-                (x_offset, 33.0),
-            ]
-        )
-        geometries.append(polygon)
-
-    gdf = gpd.GeoDataFrame(df, geometry=geometries, crs="EPSG:4326")
+    gdf = gpd.GeoDataFrame(df, geometry=_GEOMETRIES, crs="EPSG:4326")
     return gdf
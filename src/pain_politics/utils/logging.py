@@ -4,18 +4,38 @@ from __future__ import annotations
 
 import logging
 import sys
-from typing import Optional
+from typing import Optional, Set
 
 
 LOG_FORMAT = "%(asctime)s | %(levelname)-8s | %(name)s | %(message)s"
 
+PACKAGE_LOGGER = "pain_politics"
 
-def get_logger(name: Optional[str] = None) -> logging.Logger:
-    """Return a logger configured with a consistent formatter."""
-    logger = logging.getLogger(name)
-    if not logger.handlers:
+_configured: Set[str] = set()
+
+
+def _configure_once(top_level: str) -> None:
+    """Set up a top-level logger (the package or a script's ``__main__``) on first use.
+
+    The logger is set to INFO and keeps propagating, so root handlers, pytest's
+    ``caplog`` and a notebook or application's own setup all receive its
+    records. The project handler is attached only when the root logger has no
+    handlers yet; the root logger itself is never touched, so third-party INFO
+    records stay quiet.
+    """
+    if top_level in _configured:
+        return
+    logger = logging.getLogger(top_level)
+    logger.setLevel(logging.INFO)
+    if not logging.getLogger().hasHandlers():
         handler = logging.StreamHandler(sys.stdout)
         handler.setFormatter(logging.Formatter(LOG_FORMAT))
         logger.addHandler(handler)
-        logger.setLevel(logging.INFO)
-    return logger
+    _configured.add(top_level)
+
+
+def get_logger(name: Optional[str] = None) -> logging.Logger:
+    """Return a logger configured with a consistent formatter."""
+    name = name or PACKAGE_LOGGER
+    _configure_once(name.split(".", 1)[0])
+    return logging.getLogger(name)
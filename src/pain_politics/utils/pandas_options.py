@@ -0,0 +1,16 @@
+"""Process-wide pandas settings for the modules that rely on shallow copies."""
+
+from __future__ import annotations
+
+
+def enable_copy_on_write() -> None:
+    """
+    Turn on pandas Copy-on-Write so shallow copies stay isolated from their source.
+
+    CoW is always on from pandas 3.0, where the option is deprecated, so it is
+    only set explicitly on older releases.
+    """
+    import pandas as pd
+
+    if int(pd.__version__.split(".", 1)[0]) < 3:
+        pd.set_option("mode.copy_on_write", True)
@@ -1,16 +1,164 @@
 from __future__ import annotations
 
 from pathlib import Path
+from typing import TYPE_CHECKING, Iterator
 
+import geopandas as gpd
+import numpy as np
+import pandas as pd
 import pytest
 
-from pain_politics.config import ProjectPaths
+import pain_politics.config as config_module
+import pain_politics.data.catalog as catalog_module
+import pain_politics.data.loaders as loaders_module
+from pain_politics.config import ProjectPaths, paths
+from pain_politics.data.loaders import (
+    load_cdc_places,
+    load_county_boundaries,
+    load_county_health_rankings,
+    load_election_returns,
+)
 
+if TYPE_CHECKING:
+    from libpysal.weights import W
 
-@pytest.fixture()
-def project_paths_tmp(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> ProjectPaths:
-    """Provide an isolated project directory for tests."""
-    root = tmp_path / "project"
+
+def _require(path: Path, what: str) -> None:
+    """Skip the requesting test when a real data file is not on disk."""
+    if not path.exists():
+        pytest.skip(f"Real {what} data not available")
+
+
+@pytest.fixture(scope="session")
+def election_2016_df() -> pd.DataFrame:
+    """2016 county presidential returns, parsed once per session."""
+    _require(paths.data_raw / "elections" / "county_presidential_2016.csv", "election")
+    return load_election_returns(year=2016)
+
+
+@pytest.fixture(scope="session")
+def county_boundaries_gdf() -> gpd.GeoDataFrame:
+    """TIGER county boundaries, read once per session."""
+    _require(paths.data_raw / "shapefiles" / "tl_2023_us_county.shp", "shapefile")
+    return load_county_boundaries()
+
+
+@pytest.fixture(scope="session")
+def cdc_places_df() -> pd.DataFrame:
+    """CDC PLACES county indicators, parsed once per session."""
+    _require(paths.data_raw / "cdc_places" / "places_county_2023.csv", "CDC PLACES")
+    return load_cdc_places()
+
+
+_CHR_LOADER_ARGS = {
+    2016: {
+        "select_metrics": {
+            "poor_physical_health_days_raw_value": "chr_poor_physical_health_days_2016",
+            "poor_mental_health_days_raw_value": "chr_poor_mental_health_days_2016",
+            "drug_overdose_deaths_raw_value": "chr_drug_overdose_deaths_per_100k_2016",
+        },
+    },
+    2024: {},
+}
+
+
+@pytest.fixture(scope="session", params=sorted(_CHR_LOADER_ARGS))
+def chr_df(request: pytest.FixtureRequest) -> tuple[int, pd.DataFrame]:
+    """``(release_year, frame)`` for each CHR release, parsed once per session."""
+    year = request.param
+    _require(paths.data_raw / f"analytic_data{year}.csv", f"CHR {year}")
+    return year, load_county_health_rankings(year, **_CHR_LOADER_ARGS[year])
+
+
+@pytest.fixture(scope="session")
+def chr_2016_df() -> pd.DataFrame:
+    """County Health Rankings 2016 with default metrics, parsed once per session."""
+    _require(paths.data_raw / "analytic_data2016.csv", "CHR")
+    return load_county_health_rankings(release_year=2016)
+
+
+@pytest.fixture(scope="session")
+def chr_2024_df() -> pd.DataFrame:
+    """County Health Rankings 2024 with default metrics, parsed once per session."""
+    _require(paths.data_raw / "analytic_data2024.csv", "CHR 2024")
+    return load_county_health_rankings(release_year=2024)
+
+
+@pytest.fixture(scope="session")
+def analysis_gdf(request: pytest.FixtureRequest) -> gpd.GeoDataFrame:
+    """
+    Load the processed analysis GeoJSON once for the whole test session.
+
+    The parsed GeoJSON is cached as GeoParquet in pytest's cache directory,
+    keyed on the GeoJSON's size and mtime, so later sessions skip the parse
+    until the file is rebuilt. Nothing is written into ``data/processed``.
+    """
+    path = paths.data_processed / "counties_analysis.geojson"
+    if not path.exists():
+        pytest.skip("Processed data not available")
+    stat = path.stat()
+    cache_dir = request.config.cache.mkdir("analysis_gdf")
+    cache = cache_dir / f"counties_analysis-{stat.st_size}-{stat.st_mtime_ns}.parquet"
+    if cache.exists():
+        return gpd.read_parquet(cache)
+
+    gdf = gpd.read_file(path, engine="pyogrio", use_arrow=True)
+    for stale in cache_dir.glob("counties_analysis-*.parquet"):
+        stale.unlink(missing_ok=True)
+    gdf.to_parquet(cache)
+    return gdf
+
+
+@pytest.fixture(scope="session")
+def geom_validity(analysis_gdf: gpd.GeoDataFrame) -> np.ndarray:
+    """GEOS validity of every analysis geometry, evaluated once per session."""
+    return analysis_gdf.geometry.is_valid.to_numpy()
+
+
+@pytest.fixture(scope="session")
+def fips_valid(analysis_gdf: gpd.GeoDataFrame) -> np.ndarray:
+    """Whether each analysis FIPS code is a 5-digit string, evaluated once per session."""
+    fips = analysis_gdf["fips"].str
+    return (fips.len().to_numpy() == 5) & fips.isdigit().to_numpy(dtype=bool, na_value=False)
+
+
+@pytest.fixture(scope="session")
+def spatial_weights(analysis_gdf: gpd.GeoDataFrame) -> W:
+    """Queen contiguity weights for ``analysis_gdf``, built once per session."""
+    from libpysal.weights import Queen
+
+    return Queen.from_dataframe(analysis_gdf, use_index=True)
+
+
+# How each Moran's I column handles missing values, as the original tests did:
+# mean-fill keeps every county, dropna tests the observed counties only
+_MORAN_NA_HANDLING = {"trump_share_2016": "fill", "freq_phys_distress_pct": "drop"}
+
+
+@pytest.fixture(scope="session", params=sorted(_MORAN_NA_HANDLING))
+def moran_result(request, analysis_gdf: gpd.GeoDataFrame, spatial_weights: W):
+    """Global Moran's I per column, with permutation inference run once per session."""
+    from esda import Moran
+    from libpysal.weights import w_subset
+
+    column = request.param
+    if column not in analysis_gdf.columns:
+        pytest.skip(f"{column} not available")
+    if analysis_gdf[column].notna().sum() < 100:
+        pytest.skip("Insufficient non-null data")
+
+    values = analysis_gdf[column]
+    if _MORAN_NA_HANDLING[column] == "fill":
+        return column, Moran(values.fillna(values.mean()).to_numpy(), spatial_weights, permutations=999)
+
+    # Subset the weights to the observed counties so they stay aligned
+    observed = values.dropna()
+    w = w_subset(spatial_weights, observed.index.tolist())
+    return column, Moran(observed.to_numpy(), w, permutations=999)
+
+
+def _patched_project_paths(root: Path, monkeypatch: pytest.MonkeyPatch) -> ProjectPaths:
+    """Create project directories under ``root`` and point the package at them."""
     data_root = root / "data"
     project_paths = ProjectPaths(
         root=root,
@@ -27,12 +175,21 @@ def project_paths_tmp(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Projec
     project_paths.ensure()
 
     # Monkeypatch modules that cache the global `paths`.
-    import pain_politics.config as config_module
-    import pain_politics.data.catalog as catalog_module
-    import pain_politics.data.loaders as loaders_module
-
     monkeypatch.setattr(config_module, "paths", project_paths, raising=False)
     monkeypatch.setattr(catalog_module, "paths", project_paths, raising=False)
     monkeypatch.setattr(loaders_module, "paths", project_paths, raising=False)
 
     return project_paths
+
+
+@pytest.fixture(scope="module")
+def project_paths_tmp(tmp_path_factory: pytest.TempPathFactory) -> Iterator[ProjectPaths]:
+    """Provide a project directory shared by the tests of one module."""
+    with pytest.MonkeyPatch.context() as monkeypatch:
+        yield _patched_project_paths(tmp_path_factory.mktemp("project"), monkeypatch)
+
+
+@pytest.fixture()
+def isolated_project_paths(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> ProjectPaths:
+    """Provide a fresh project directory for tests that write into it."""
+    return _patched_project_paths(tmp_path / "project", monkeypatch)
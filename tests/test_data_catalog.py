@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 from pain_politics.data import DataCatalog, validate_required_files
+from pain_politics.data.catalog import DataAsset
 
 
 def test_data_catalog_flags_missing_assets(project_paths_tmp):
@@ -9,3 +10,14 @@ def test_data_catalog_flags_missing_assets(project_paths_tmp):
 
     assert valid is False
     assert missing  # Should list at least one missing asset
+
+
+def test_data_asset_accepts_parquet_twin(isolated_project_paths):
+    csv_path = isolated_project_paths.data_raw / "elections" / "county_presidential_2016.csv"
+    asset = DataAsset(name="returns", path=csv_path, acquisition="manual", parquet_twin=True)
+    assert asset.exists is False
+
+    csv_path.parent.mkdir(parents=True, exist_ok=True)
+    csv_path.with_suffix(".parquet").touch()
+    assert asset.exists is True
+    assert asset.resolved_path == csv_path.with_suffix(".parquet")
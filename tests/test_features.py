@@ -1,8 +1,11 @@
 from __future__ import annotations
 
+import geopandas as gpd
+import numpy as np
 import pandas as pd
+from shapely.geometry import box
 
-from pain_politics.features import compute_distress_metrics
+from pain_politics.features import add_spatial_lag, build_spatial_weights, compute_distress_metrics
 
 
 def test_compute_distress_metrics_adds_expected_columns():
@@ -22,3 +25,39 @@ def test_compute_distress_metrics_adds_expected_columns():
     assert "od_rate_change" in enriched.columns
     assert "distress_trump_zscore" in enriched.columns
     assert enriched["trump_shift_16_20"].iloc[0] == 5.0
+
+
+def test_add_spatial_lag_averages_queen_neighbors():
+    # 2x2 grid: every cell touches the other three under queen contiguity
+    gdf = gpd.GeoDataFrame(
+        {"value": [1.0, 2.0, 3.0, np.nan]},
+        geometry=[box(x, y, x + 1, y + 1) for y in range(2) for x in range(2)],
+    )
+
+    lagged = add_spatial_lag(gdf, "value")
+
+    assert np.allclose(lagged["value_lag"], [5 / 3, 4 / 3, 1.0, 2.0])
+
+
+def test_queen_weights_match_libpysal_with_overlapping_polygons():
+    from libpysal.weights import Queen
+
+    # Two touching cells, plus a pair that overlaps the second cell without
+    # sharing a vertex with it: overlap is not contiguity
+    gdf = gpd.GeoDataFrame(
+        geometry=[
+            box(0, 0, 1, 1),
+            box(1, 0, 2, 1),
+            box(1.2, 0.2, 1.8, 0.8),
+            box(1.5, 0.5, 2.5, 1.5),
+        ],
+        index=["a", "b", "c", "d"],
+    )
+
+    w = build_spatial_weights(gdf, weight_type="queen")
+    expected = Queen.from_dataframe(gdf, use_index=True, silence_warnings=True)
+
+    assert {k: sorted(v) for k, v in w.neighbors.items()} == {
+        k: sorted(v) for k, v in expected.neighbors.items()
+    }
+    assert w.neighbors["a"] == ["b"]
@@ -0,0 +1,43 @@
+from __future__ import annotations
+
+import numpy as np
+import pandas as pd
+
+from pain_politics.data.loaders import load_cdc_places, load_county_health_rankings
+
+PLACES_HEADER = "DataValueTypeID,LocationID,MeasureId,Data_Value\n"
+
+
+def test_places_cache_is_keyed_on_source_path(isolated_project_paths):
+    first = isolated_project_paths.data_raw / "a" / "places_county_2023.csv"
+    second = isolated_project_paths.data_raw / "b" / "places_county_2023.csv"
+    for path, value in [(first, "21.5"), (second, "34.0")]:
+        path.parent.mkdir(parents=True)
+        path.write_text(PLACES_HEADER + f"AgeAdjPrv,1001,ARTHRITIS,{value}\n")
+
+    load_cdc_places.cache_clear()
+    assert load_cdc_places(file_path=first)["arthritis_pct"].tolist() == [21.5]
+    load_cdc_places.cache_clear()
+    assert load_cdc_places(file_path=second)["arthritis_pct"].tolist() == [34.0]
+    load_cdc_places.cache_clear()
+
+
+def test_chr_flag_columns_stay_integer(isolated_project_paths):
+    path = isolated_project_paths.data_raw / "analytic_data2024.csv"
+    path.write_text(
+        "State FIPS Code,County FIPS Code,5-digit FIPS Code,Name,Release Year,"
+        "County Ranked (Yes=1/No=0),County Clustered (Yes=1/No=0),"
+        "Frequent Physical Distress raw value\n"
+        "01,000,01000,Alabama,2024,,,0.14\n"
+        "01,001,01001,Autauga County,2024,1,1,0.13\n"
+        "01,003,01003,Baldwin County,2024,1,,0.12\n"
+    )
+
+    load_county_health_rankings.cache_clear()
+    df = load_county_health_rankings(2024)
+    load_county_health_rankings.cache_clear()
+
+    assert df["fips"].tolist() == ["01001", "01003"]
+    assert df["chr_county_ranked"].dtype == "Int64"
+    assert df["chr_county_clustered"].tolist() == [1, pd.NA]
+    assert df["chr_freq_phys_distress_pct"].dtype == np.float64
@@ -0,0 +1,15 @@
+from __future__ import annotations
+
+import logging
+
+from pain_politics.utils import get_logger
+
+
+def test_package_records_reach_root_handlers(caplog):
+    logger = get_logger("pain_politics.tests")
+
+    with caplog.at_level(logging.INFO):
+        logger.info("pipeline step done")
+
+    assert logging.getLogger("pain_politics").propagate
+    assert [r.getMessage() for r in caplog.records] == ["pipeline step done"]
@@ -1,8 +1,12 @@
 from __future__ import annotations
 
 import geopandas as gpd
+import numpy as np
+import pandas as pd
+from shapely.geometry import Point
 
 from pain_politics.pipeline import build_analysis_dataset
+from pain_politics.pipeline.build import _geojson_export_frame
 
 
 def test_build_dataset_with_sample_data(project_paths_tmp):
@@ -15,3 +19,45 @@ def test_build_dataset_with_sample_data(project_paths_tmp):
     assert isinstance(gdf, gpd.GeoDataFrame)
     assert {"trump_shift_16_20", "od_rate_change", "distress_trump_zscore"} <= set(gdf.columns)
     assert gdf.geometry.notnull().all()
+
+
+def test_geojson_export_keeps_counts_exact(tmp_path):
+    gdf = gpd.GeoDataFrame(
+        {
+            "od_1720_population": [10014009.0, 123456789.0, np.nan],
+            "trump_share_2016": [73.9, 1 / 3, 68.5],
+        },
+        geometry=[Point(0, 0), Point(1, 1), Point(2, 2)],
+        crs="EPSG:4326",
+    )
+    target = tmp_path / "counties.geojson"
+    _geojson_export_frame(gdf).to_file(target, driver="GeoJSON")
+
+    text = target.read_text()
+    assert '"od_1720_population": 10014009,' in text
+    assert '"od_1720_population": 123456789,' in text
+    assert '"trump_share_2016": 0.3333333' in text
+
+    written = gpd.read_file(target)
+    assert written["od_1720_population"].iloc[:2].tolist() == [10014009, 123456789]
+    assert written["trump_share_2016"].iloc[0] == 73.9
+
+
+def test_geojson_export_frame_casts_counts_and_rounds_fractions():
+    values = np.array([123.456789012, -0.000123456789, 98765432.1, 0.0, np.nan, 9.99999999])
+    gdf = gpd.GeoDataFrame(
+        {
+            "total_votes_2016": [24973.0, np.nan, 10014009.0, 0.0, 5.0, 7.0],
+            "od_1316_rate": values,
+        },
+        geometry=[Point(i, i) for i in range(len(values))],
+        crs="EPSG:4326",
+    )
+
+    export = _geojson_export_frame(gdf)
+
+    assert export["total_votes_2016"].dtype == "Int64"
+    assert export["total_votes_2016"].tolist() == [24973, pd.NA, 10014009, 0, 5, 7]
+    expected = [float(f"{v:.7g}") for v in values]
+    np.testing.assert_array_equal(export["od_1316_rate"].to_numpy(), expected)
+    assert gdf["total_votes_2016"].dtype == np.float64
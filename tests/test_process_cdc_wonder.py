@@ -0,0 +1,44 @@
+from __future__ import annotations
+
+import importlib.util
+from pathlib import Path
+
+import pandas as pd
+
+SCRIPT = Path(__file__).resolve().parents[1] / "scripts" / "process_cdc_wonder.py"
+
+WONDER_EXPORT = '''"Notes","County","County Code","Deaths","Population","Crude Rate"
+,"Autauga County, AL","01001",35,55601,"Unreliable"
+,"Baldwin County, AL","01003",210,218022,96.3
+,"Barbour County, AL","01005","Suppressed",24881,"Suppressed"
+"Total",,,245,298504,82.1
+"---"
+"Dataset: Multiple Cause of Death, 1999-2020"
+"Query Parameters:"
+"Grouped By: County"
+"---"
+'''
+
+
+def _load_script():
+    spec = importlib.util.spec_from_file_location("process_cdc_wonder", SCRIPT)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def test_process_cdc_wonder_skips_footer_rows(isolated_project_paths, monkeypatch):
+    script = _load_script()
+    monkeypatch.setattr(script, "paths", isolated_project_paths)
+
+    input_file = isolated_project_paths.data_raw / "cdc_wonder" / "wonder_export.csv"
+    input_file.parent.mkdir(parents=True, exist_ok=True)
+    input_file.write_text(WONDER_EXPORT, encoding="utf-8")
+
+    assert script.process_cdc_wonder_file(input_file) == 0
+
+    output = isolated_project_paths.data_raw / "cdc_wonder" / "overdose_2013_2016.txt"
+    df = pd.read_csv(output, sep="\t", dtype={"County Code": str})
+    assert df["County Code"].tolist() == ["01001", "01003", "01005"]
+    assert df["Deaths"].isna().tolist() == [False, False, True]
+    assert df["Age Adjusted Rate"].isna().tolist() == [True, False, True]
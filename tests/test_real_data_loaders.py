@@ -1,26 +1,14 @@
 """Tests for data loaders with real data files."""
 from __future__ import annotations
 
-import pytest
+import numpy as np
 import pandas as pd
 import geopandas as gpd
 
-from pain_politics.data.loaders import (
-    load_election_returns,
-    load_county_boundaries,
-    load_cdc_places,
-    load_county_health_rankings,
-)
-from pain_politics.config import paths
 
-
-@pytest.mark.skipif(
-    not (paths.data_raw / "elections" / "county_presidential_2016.csv").exists(),
-    reason="Real election data not available"
-)
-def test_load_election_returns_2016_real_data():
+def test_load_election_returns_2016_real_data(election_2016_df):
     """Test loading 2016 election returns with real data."""
-    df = load_election_returns(year=2016)
+    df = election_2016_df
     
     assert isinstance(df, pd.DataFrame)
     assert "fips" in df.columns
@@ -32,20 +20,17 @@ def test_load_election_returns_2016_real_data():
     assert valid_fips_count / len(df) > 0.99, "At least 99% of FIPS codes should be 5 digits"
     
     # Check percentages are in valid range (excluding nulls)
-    valid_shares = df["trump_share_2016"].dropna()
-    assert valid_shares.between(0, 100).all(), "Trump shares should be between 0-100%"
+    valid_shares = df["trump_share_2016"].dropna().to_numpy()
+    assert valid_shares.size == 0 or (valid_shares.min() >= 0 and valid_shares.max() <= 100), \
+        "Trump shares should be between 0-100%"
     
     # Check we have a reasonable number of counties
     assert len(df) > 3000  # US has ~3100+ counties
 
 
-@pytest.mark.skipif(
-    not (paths.data_raw / "shapefiles" / "tl_2023_us_county.shp").exists(),
-    reason="Real shapefile data not available"
-)
-def test_load_county_boundaries_real_data():
+def test_load_county_boundaries_real_data(county_boundaries_gdf):
     """Test loading county boundaries with real shapefile."""
-    gdf = load_county_boundaries()
+    gdf = county_boundaries_gdf
     
     assert isinstance(gdf, gpd.GeoDataFrame)
     assert "fips" in gdf.columns
@@ -59,13 +44,9 @@ def test_load_county_boundaries_real_data():
     assert len(gdf) > 3000
 
 
-@pytest.mark.skipif(
-    not (paths.data_raw / "cdc_places" / "places_county_2023.csv").exists(),
-    reason="Real CDC PLACES data not available"
-)
-def test_load_cdc_places_real_data():
+def test_load_cdc_places_real_data(cdc_places_df):
     """Test loading CDC PLACES data with real file."""
-    df = load_cdc_places()
+    df = cdc_places_df
     
     assert isinstance(df, pd.DataFrame)
     assert "fips" in df.columns
@@ -77,20 +58,17 @@ def test_load_cdc_places_real_data():
         "freq_mental_distress_pct",
         "depression_pct",
     ]
-    for col in expected_cols:
-        if col in df.columns:
-            # Check percentages are numeric and in valid range
-            assert pd.api.types.is_numeric_dtype(df[col])
-            assert df[col].between(0, 100).all() or df[col].isna().any()
+    block = df[[col for col in expected_cols if col in df.columns]]
+    # Check percentages are numeric and in valid range, column by column
+    assert all(pd.api.types.is_numeric_dtype(dtype) for dtype in block.dtypes)
+    values = block.to_numpy(dtype=np.float64, na_value=np.nan)
+    in_range = ((values >= 0) & (values <= 100)).all(axis=0)
+    assert (np.isnan(values).any(axis=0) | in_range).all()
 
 
-@pytest.mark.skipif(
-    not (paths.data_raw / "analytic_data2016.csv").exists(),
-    reason="Real CHR data not available"
-)
-def test_load_chr_2016_real_data():
+def test_load_chr_2016_real_data(chr_2016_df):
     """Test loading County Health Rankings 2016 with real data."""
-    df = load_county_health_rankings(release_year=2016)
+    df = chr_2016_df
     
     assert isinstance(df, pd.DataFrame)
     assert "fips" in df.columns
@@ -102,13 +80,9 @@ def test_load_chr_2016_real_data():
     assert len(df.columns) > 5
 
 
-@pytest.mark.skipif(
-    not (paths.data_raw / "analytic_data2024.csv").exists(),
-    reason="Real CHR 2024 data not available"
-)
-def test_load_chr_2024_real_data():
+def test_load_chr_2024_real_data(chr_2024_df):
     """Test loading County Health Rankings 2024 with real data."""
-    df = load_county_health_rankings(release_year=2024)
+    df = chr_2024_df
     
     assert isinstance(df, pd.DataFrame)
     assert "fips" in df.columns
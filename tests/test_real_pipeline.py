@@ -41,6 +41,7 @@ def test_build_dataset_with_real_data():
     
     # Check FIPS codes are 5 digits
     assert gdf["fips"].str.len().eq(5).all()
+    assert gdf["fips"].str.isdigit().all()
     
     # Check derived metrics exist
     if "distress_trump_zscore" in gdf.columns:
@@ -53,7 +54,9 @@ def test_build_dataset_with_real_data():
 )
 def test_read_processed_geojson():
     """Test reading the processed GeoJSON output."""
-    gdf = gpd.read_file(paths.data_processed / "counties_analysis.geojson")
+    gdf = gpd.read_file(
+        paths.data_processed / "counties_analysis.geojson", engine="pyogrio", use_arrow=True
+    )
     
     assert isinstance(gdf, gpd.GeoDataFrame)
     assert len(gdf) > 3000